@@ -5,8 +5,7 @@ from __future__ import annotations
 import subprocess
 from importlib import metadata
 from pathlib import Path
-
-from .cli import app
+from typing import Any
 
 
 def _resolve_version() -> str:
@@ -36,3 +35,12 @@ def _resolve_version() -> str:
 __version__ = _resolve_version()
 print(__version__)
 __all__ = ["app", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # The CLI pulls in typer and rich; only load it when ``agx.app`` is requested.
+    if name == "app":
+        from .cli import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,23 @@
 """Agent package exports."""
 
-from .base import Agent, PlanningConfig
-from .orchestrator import Orchestrator
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "Agent": ".base",
+    "PlanningConfig": ".base",
+    "Orchestrator": ".orchestrator",
+}
 
 __all__ = ["Agent", "PlanningConfig", "Orchestrator"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
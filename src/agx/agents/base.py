@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import json
-import textwrap
 from dataclasses import dataclass
-from typing import Dict, List
+from pathlib import Path
+from typing import Any, Dict, List
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # pragma: no cover - optional dependency
+    from fix_busted_json import repair_json
+except Exception:  # pragma: no cover - optional dependency
+    repair_json = None
+
+from ..llm.cache import LLMCache, cache_key
 from ..llm.provider import LLMProvider, PromptContext
 from ..memory.simple import ConversationBufferMemory
 from ..tasks.base import Task, TaskResult
 from ..tools.base import Tool, ToolContext
+from ..tools.schema import compact_description
 
 
 @dataclass
@@ -31,6 +43,46 @@ class AgentAction:
 class PlanningConfig:
     max_iterations: int
     reflection: bool
+    cache_enabled: bool = False
+
+
+def _loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _decode_json(response: str) -> Any:
+    """Decode model output, tolerating markdown fences and minor syntax slips."""
+
+    try:
+        return _loads(response)
+    except ValueError:
+        pass
+    cleaned = response.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    try:
+        return _loads(cleaned)
+    except ValueError:
+        pass
+    if repair_json is None or not cleaned.startswith(("{", "[")):
+        return None
+    try:
+        return _loads(repair_json(cleaned))
+    except Exception:
+        return None
+
+
+def _is_complete_action(text: str) -> bool:
+    """Return True once ``text`` holds a full JSON action object."""
+
+    cleaned = text.strip().removeprefix("```json").removeprefix("```").strip()
+    if not cleaned.startswith("{"):
+        return False
+    try:
+        payload = _loads(cleaned)
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and ("action" in payload or "answer" in payload)
 
 
 class Agent:
@@ -45,6 +97,7 @@ class Agent:
         planning: PlanningConfig,
         memory: ConversationBufferMemory | None = None,
         self_deciding: bool = False,
+        llm_cache: LLMCache | None = None,
     ) -> None:
         self.name = name
         self.description = description
@@ -53,6 +106,20 @@ class Agent:
         self.planning = planning
         self.memory = memory or ConversationBufferMemory()
         self.self_deciding = self_deciding
+        if llm_cache is None and planning.cache_enabled:
+            llm_cache = LLMCache(Path(".agx") / "llm_cache.db")
+        self.llm_cache = llm_cache
+        self._tools_desc: str | None = None
+
+    def tools_description(self) -> str:
+        """Return the prompt listing of this agent's tools, built once per agent."""
+
+        if self._tools_desc is None:
+            self._tools_desc = "\n".join(
+                f"- {name}: {compact_description(tool.description)}"
+                for name, tool in sorted(self.tools.items())
+            )
+        return self._tools_desc
 
     def run_task(self, task: Task) -> TaskResult:
         loop = PlanningLoop(agent=self, task=task)
@@ -60,49 +127,96 @@ class Agent:
 
 
 class PlanningLoop:
-    """Simple ReAct-style planning loop."""
+    """Simple ReAct-style planning loop.
+
+    Prompts keep static content (agent identity, tools, task) at the beginning and
+    volatile content (memory, iteration) at the end so provider-side prompt caches
+    can reuse the shared prefix across iterations.
+    """
 
     def __init__(self, agent: Agent, task: Task) -> None:
         self.agent = agent
         self.task = task
         self.trace: List[str] = []
+        self._tools_desc = agent.tools_description()
+        # Resolve provider entry points once per task rather than per iteration.
+        self._provider_generate = agent.llm_provider.generate
+        self._provider_stream = getattr(agent.llm_provider, "stream", None)
+        self._static_prompt: str | None = None
 
     def execute(self) -> TaskResult:
-        for iteration in range(1, self.agent.planning.max_iterations + 1):
-            prompt = self._build_prompt(iteration)
-            context = PromptContext(
-                agent_name=self.agent.name,
-                task_id=self.task.id,
-                iteration=iteration,
-            )
-            response = self.agent.llm_provider.generate(prompt, context)
-            action = self._parse_response(response)
-            self.trace.append(f"model@{iteration}: {response}")
+        # Loop invariants are read once into locals instead of per iteration.
+        task = self.task
+        agent_name = self.agent.name
+        max_iterations = self.agent.planning.max_iterations
+        remember = self.agent.memory.add
+        record = self.trace.append
+        build_prompt = self._build_prompt
+        generate = self._generate
+        parse = self._parse_response
+        for iteration in range(1, max_iterations + 1):
+            prompt = build_prompt(iteration)
+            context = PromptContext(agent_name=agent_name, task_id=task.id, iteration=iteration)
+            response = generate(prompt, context)
+            action = parse(response)
+            record(f"model@{iteration}: {response}")
             if action.is_final:
-                self.agent.memory.add("assistant", action.answer or action.action_input)
+                remember("assistant", action.answer or action.action_input)
                 return TaskResult(
-                    task=self.task,
+                    task=task,
                     success=True,
                     output=action.answer or action.action_input,
                     iterations=iteration,
                     trace=self.trace,
                 )
             observation = self._invoke_tool(action, iteration)
-            self.agent.memory.add("tool", observation)
+            remember("tool", observation)
         # max iterations reached
         return TaskResult(
-            task=self.task,
+            task=task,
             success=False,
             output="Max iterations reached without final answer",
-            iterations=self.agent.planning.max_iterations,
+            iterations=max_iterations,
             trace=self.trace,
         )
 
+    def _generate(self, prompt: str, context: PromptContext) -> str:
+        cache = self.agent.llm_cache
+        if cache is None:
+            return self._call_provider(prompt, context)
+        key = cache_key(self.agent.llm_provider, prompt, context)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        response = self._call_provider(prompt, context)
+        cache.set(key, response)
+        return response
+
+    def _call_provider(self, prompt: str, context: PromptContext) -> str:
+        if self._provider_stream is None:
+            return self._provider_generate(prompt, context)
+        # Stop reading as soon as a complete action object has arrived; closing the
+        # stream lets the provider abort the rest of the generation.
+        chunks = self._provider_stream(prompt, context)
+        parts: List[str] = []
+        try:
+            for chunk in chunks:
+                parts.append(chunk)
+                if "}" in chunk and _is_complete_action("".join(parts)):
+                    break
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        return "".join(parts).strip()
+
     def _build_prompt(self, iteration: int) -> str:
-        tools_desc = "\n".join(
-            f"- {name}: {tool.description}" for name, tool in self.agent.tools.items()
-        )
-        memory_dump = "\n".join(f"{item.role}: {item.content}" for item in self.agent.memory.dump())
+        if self._static_prompt is None:
+            self._static_prompt = self._build_static_prompt()
+        memory_dump = self.agent.memory.rendered()
+        return f"{self._static_prompt}\nCurrent memory:\n{memory_dump or 'empty'}\nIteration: {iteration}"
+
+    def _build_static_prompt(self) -> str:
         if self.agent.self_deciding:
             behavior_note = (
                 "You may propose actions, commands, or code as recommendations. "
@@ -110,24 +224,23 @@ class PlanningLoop:
             )
         else:
             behavior_note = "Do not output code or commands. Provide recommendations only."
-        scratch = textwrap.dedent(
-            f"""
-            You are agent {self.agent.name}. Task: {self.task.description}.
-            You MUST respond using JSON with keys thought, action, input, answer (answer required when action == "final").
-            Tools available:\n{tools_desc or '- none'}
-            Task input: {self.task.input}
-            Context: {self.task.context}
-            Current memory:\n{memory_dump or 'empty'}
-            Behavior: {behavior_note}
-            Iteration: {iteration}
-            """
-        ).strip()
-        return scratch
+        return (
+            f"You are agent {self.agent.name}. Task: {self.task.description}.\n"
+            'You MUST respond using JSON with keys thought, action, input, answer (answer required when action == "final").\n'
+            f"Behavior: {behavior_note}\n"
+            f"Tools available:\n{self._tools_desc or '- none'}\n"
+            f"Task input: {self.task.input}\n"
+            f"Context: {self.task.context}"
+        )
 
     def _parse_response(self, response: str) -> AgentAction:
-        try:
-            payload = json.loads(response)
-        except json.JSONDecodeError:
+        # Only an object (possibly fenced) can describe a tool call; skip decoding
+        # plain-text answers such as "FINAL: ...".
+        if response.lstrip().startswith(("{", "```")):
+            payload = _decode_json(response)
+        else:
+            payload = None
+        if not isinstance(payload, dict):
             # Treat as direct answer
             return AgentAction(
                 thought="Responding directly",
@@ -4,14 +4,14 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from ..config import AgentSpec, ProjectConfig, instantiate_from_path
 from ..llm.provider import LLMProvider
 from ..memory.simple import ConversationBufferMemory
 from ..runtime.integrations import RuntimeIntegrations, build_runtime_integrations
 from ..tasks.base import HumanApprovalTask, HumanInputTask, Task
-from ..tasks.runner import TaskRunner
+from ..tasks.runner import TaskRunner, resolve_max_workers, resolve_parallel_agents
 from ..tools.builtin import register_builtin_tools
 from ..tools.registry import ToolRegistry
 from .base import Agent, PlanningConfig
@@ -24,6 +24,7 @@ class Orchestrator:
         self,
         project_config: ProjectConfig,
         integrations: Optional[RuntimeIntegrations] = None,
+        max_workers: int = 1,
     ) -> None:
         self.config = project_config
         self.integrations = integrations or build_runtime_integrations(
@@ -50,7 +51,27 @@ class Orchestrator:
         self.tool_registry.configure_from_specs(self.config.tool_specs)
         self.agents: Dict[str, Agent] = self._build_agents()
         self.tasks = self._build_tasks()
-        self.runner = TaskRunner(self._resolve_agent, integrations=self.integrations)
+        self.runner = TaskRunner(
+            self._resolve_agent,
+            integrations=self.integrations,
+            max_workers=resolve_max_workers(self.config.agents.values(), max_workers),
+            parallel_agents=resolve_parallel_agents(self.config.agents.values(), max_workers),
+        )
+
+    @classmethod
+    def describe(cls, project_config: ProjectConfig) -> Dict[str, List[Dict[str, Any]]]:
+        """Summarise agents and tasks without building providers, tools, or runners."""
+
+        return {
+            "agents": [
+                {"name": spec.name, "tools": list(dict.fromkeys(spec.tools))}
+                for spec in project_config.agents.values()
+            ],
+            "tasks": [
+                {"id": spec.id, "agent": spec.agent, "description": spec.description}
+                for spec in project_config.tasks
+            ],
+        }
 
     def _resolve_agent(self, name: str) -> Agent:
         try:
@@ -77,6 +98,7 @@ class Orchestrator:
         planning = PlanningConfig(
             max_iterations=spec.planning.max_iterations,
             reflection=spec.planning.reflection,
+            cache_enabled=spec.planning.cache or _is_deterministic(provider_params),
         )
         tools = {name: self.tool_registry.get(name) for name in spec.tools}
         description = spec.description or "General agent"
@@ -152,3 +174,12 @@ class Orchestrator:
         for task_id, result in results.items():
             outputs[task_id] = result.output
         return outputs
+
+
+def _is_deterministic(params: Dict[str, object]) -> bool:
+    options = params.get("options")
+    temperature = options.get("temperature") if isinstance(options, dict) else params.get("temperature")
+    try:
+        return temperature is not None and float(temperature) == 0.0
+    except (TypeError, ValueError):
+        return False
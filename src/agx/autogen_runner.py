@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import json
-import textwrap
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from autogen import AssistantAgent, UserProxyAgent
 
@@ -13,10 +14,31 @@ from .config import AgentSpec, ProjectConfig
 from .runtime.integrations import RuntimeIntegrations, build_runtime_integrations
 from .runtime.interoperability import build_handoff_payload, parse_output_text, resolve_bindings
 from .tasks.base import TaskState
-from .tasks.runner import TaskRunner, TaskStateRecord, TaskStateStore
+from .tasks.runner import (
+    TaskRunner,
+    TaskStateRecord,
+    TaskStateStore,
+    resolve_max_workers,
+    resolve_parallel_agents,
+)
 from .tools.base import ToolContext
 from .tools.builtin import register_builtin_tools
 from .tools.registry import ToolRegistry
+from .tools.schema import compact_description
+
+_SYSTEM_TMPL = (
+    "You are agent {name}. Description: {description}.\n"
+    "Use the registered functions to complete the assigned task. When you finish, respond with:\n"
+    "FINAL: <concise summary of the findings or answer>."
+)
+_TASK_TMPL = (
+    "Task: {description}\n"
+    "Task Input (JSON if available): {task_input}\n"
+    "Expected tools: {tools}\n"
+    "Behavior: {behavior}\n"
+    "Follow the workflow, calling registered functions by name.\n"
+    "When completed, respond with 'FINAL: <summary>'."
+)
 
 
 class AutogenOrchestrator:
@@ -27,6 +49,7 @@ class AutogenOrchestrator:
         project_config: ProjectConfig,
         approval_callback=None,
         integrations: Optional[RuntimeIntegrations] = None,
+        max_workers: int = 1,
     ) -> None:
         self.config = project_config
         self.integrations = integrations or build_runtime_integrations(
@@ -40,12 +63,23 @@ class AutogenOrchestrator:
         self.tool_registry.configure_from_specs(self.config.tool_specs)
         self._store = TaskStateStore(Path(".agx") / "task_state.db")
         self._approval_callback = approval_callback
+        self._max_workers = resolve_max_workers(self.config.agents.values(), max(1, int(max_workers)))
+        self._parallel_agents = resolve_parallel_agents(self.config.agents.values(), max(1, int(max_workers)))
+        # Assistants are reused across tasks sharing an agent; per-thread so that
+        # concurrent waves never share conversation state.
+        self._local = threading.local()
 
     def run(self) -> Dict[str, str]:
         outputs: Dict[str, str] = {}
         ordered = TaskRunner.order_tasks(self.config.tasks)
         input_store: Dict[str, Dict[str, Any]] = {}
         result_store: Dict[str, Dict[str, Any]] = {}
+        waves: Dict[str, List[Any]] = {}
+        prefetched: Dict[str, Future] = {}
+        pool: Optional[ThreadPoolExecutor] = None
+        if self._max_workers > 1:
+            waves = self._group_waves(ordered, self._parallel_agents)
+            pool = ThreadPoolExecutor(max_workers=self._max_workers)
 
         try:
             with self.integrations.telemetry.span(
@@ -63,16 +97,18 @@ class AutogenOrchestrator:
                         }
                     )
                 for task_spec in ordered:
-                    task_spec.input = resolve_bindings(
-                        task_spec.input,
-                        input_store=input_store,
-                        result_store=result_store,
-                    )
-                    task_spec.context = resolve_bindings(
-                        task_spec.context,
-                        input_store=input_store,
-                        result_store=result_store,
-                    )
+                    # Wave peers already had their bindings resolved when they were submitted.
+                    if task_spec.id not in prefetched:
+                        task_spec.input = resolve_bindings(
+                            task_spec.input,
+                            input_store=input_store,
+                            result_store=result_store,
+                        )
+                        task_spec.context = resolve_bindings(
+                            task_spec.context,
+                            input_store=input_store,
+                            result_store=result_store,
+                        )
 
                     if task_spec.task_type == "agent_handoff":
                         source_task = task_spec.source_task or (
@@ -210,17 +246,23 @@ class AutogenOrchestrator:
                         )
                         break
 
-                    self._store.upsert(TaskStateRecord(task_id=task_spec.id, state=TaskState.RUNNING))
-                    self.integrations.emit(
-                        {
-                            "type": "task_state",
-                            "engine": "autogen",
-                            "task_id": task_spec.id,
-                            "state": TaskState.RUNNING.value,
-                        }
-                    )
+                    if pool is not None and task_spec.id not in prefetched:
+                        # Submit every agent task of this dependency wave at once.
+                        for peer in waves.get(task_spec.id, []):
+                            if peer is not task_spec:
+                                peer.input = resolve_bindings(
+                                    peer.input, input_store=input_store, result_store=result_store
+                                )
+                                peer.context = resolve_bindings(
+                                    peer.context, input_store=input_store, result_store=result_store
+                                )
+                            self._mark_running(peer.id)
+                            prefetched[peer.id] = pool.submit(self.run_task, peer)
+                    future = prefetched.pop(task_spec.id, None)
+                    if future is None:
+                        self._mark_running(task_spec.id)
                     try:
-                        outputs[task_spec.id] = self.run_task(task_spec)
+                        outputs[task_spec.id] = future.result() if future is not None else self.run_task(task_spec)
                         self._store.upsert(
                             TaskStateRecord(
                                 task_id=task_spec.id,
@@ -258,18 +300,95 @@ class AutogenOrchestrator:
                             }
                         )
                         raise
+            self._store.flush()
             return outputs
         finally:
+            if pool is not None:
+                self._settle_prefetched(prefetched)
+                pool.shutdown(wait=True, cancel_futures=True)
             self.integrations.close()
 
+    def _settle_prefetched(self, prefetched: Dict[str, Future]) -> None:
+        """Record a final state for wave peers left behind when a run unwinds early."""
+
+        for task_id, future in prefetched.items():
+            if future.cancel():
+                state, output, error = TaskState.FAILED, None, "Cancelled: another task in its wave failed"
+            else:
+                try:
+                    state, output, error = TaskState.COMPLETED, future.result(), None
+                except Exception as exc:
+                    state, output, error = TaskState.FAILED, None, str(exc)
+            self._store.upsert(TaskStateRecord(task_id=task_id, state=state, output=output, error=error))
+            event = {"type": "task_state", "engine": "autogen", "task_id": task_id, "state": state.value}
+            if error is not None:
+                event["error"] = error
+            self.integrations.emit(event)
+        prefetched.clear()
+
+    def _mark_running(self, task_id: str) -> None:
+        self._store.upsert(TaskStateRecord(task_id=task_id, state=TaskState.RUNNING))
+        self.integrations.emit(
+            {
+                "type": "task_state",
+                "engine": "autogen",
+                "task_id": task_id,
+                "state": TaskState.RUNNING.value,
+            }
+        )
+
+    @staticmethod
+    def _group_waves(
+        ordered: List[Any], parallel_agents: Optional[FrozenSet[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """Map each agent task that can run alongside others to its parallel wave.
+
+        The serial order is kept, so a human checkpoint still stops the run at the
+        same place: waves never reach past the next human_approval/human_input
+        task. Within that span, agent tasks of equal dependency depth form a wave
+        when every dependency of each member comes before the wave's first task,
+        i.e. has finished by the time the wave is submitted. Only tasks of
+        ``parallel_agents`` (every agent when None) join a wave.
+        """
+
+        position = {task_spec.id: index for index, task_spec in enumerate(ordered)}
+        depth: Dict[str, int] = {}
+        for task_spec in ordered:
+            depth[task_spec.id] = 1 + max((depth[dep] for dep in task_spec.depends_on or []), default=-1)
+        sections: List[List[Any]] = [[]]
+        for task_spec in ordered:
+            if task_spec.task_type in {"human_approval", "human_input"}:
+                sections.append([])
+            elif task_spec.task_type != "agent_handoff" and (
+                parallel_agents is None or task_spec.agent in parallel_agents
+            ):
+                sections[-1].append(task_spec)
+        waves: Dict[str, List[Any]] = {}
+        for section in sections:
+            levels: Dict[int, List[Any]] = {}
+            for task_spec in section:
+                levels.setdefault(depth[task_spec.id], []).append(task_spec)
+            for level in levels.values():
+                start = position[level[0].id]
+                members = [
+                    member
+                    for member in level
+                    if all(position[dep] < start for dep in member.depends_on or [])
+                ]
+                if len(members) < 2:
+                    continue
+                for member in members:
+                    waves[member.id] = members
+        return waves
+
     def run_task(self, task_spec) -> str:
         with self.integrations.telemetry.span(
             "agx.autogen.run_task",
             attributes={"task.id": task_spec.id, "agent": task_spec.agent},
         ):
             agent_spec = self.config.get_agent(task_spec.agent)
-            assistant = self._build_assistant(agent_spec, task_spec.id)
-            user = self._build_user(task_spec.id)
+            assistant = self._assistant_for(agent_spec, task_spec.id)
+            user = self._user_proxy()
             prompt = self._build_task_prompt(task_spec, agent_spec)
             result = user.initiate_chat(
                 assistant,
@@ -295,7 +414,29 @@ class AutogenOrchestrator:
                         return json.dumps(parsed)
             return content
 
-    def _build_assistant(self, agent_spec: AgentSpec, task_id: str) -> AssistantAgent:
+    def _assistant_for(self, agent_spec: AgentSpec, task_id: str) -> AssistantAgent:
+        cache: Dict[Tuple[str, FrozenSet[str]], Tuple[AssistantAgent, Dict[str, str]]]
+        cache = getattr(self._local, "assistants", None)
+        if cache is None:
+            cache = self._local.assistants = {}
+        key = (agent_spec.name, frozenset(agent_spec.tools))
+        entry = cache.get(key)
+        if entry is None:
+            binding = {"task_id": task_id}
+            entry = cache[key] = (self._build_assistant(agent_spec, binding), binding)
+        assistant, binding = entry
+        binding["task_id"] = task_id
+        assistant.reset()
+        return assistant
+
+    def _user_proxy(self) -> UserProxyAgent:
+        user = getattr(self._local, "user", None)
+        if user is None:
+            user = self._local.user = self._build_user()
+        user.reset()
+        return user
+
+    def _build_assistant(self, agent_spec: AgentSpec, binding: Dict[str, str]) -> AssistantAgent:
         llm_params = self._resolve_llm_params(agent_spec)
         config_list = [
             {
@@ -305,15 +446,12 @@ class AutogenOrchestrator:
                 "api_key": llm_params.get("api_key", "NA"),
             }
         ]
-        system_message = textwrap.dedent(
-            f"""
-            You are agent {agent_spec.name}. Description: {agent_spec.description or 'General agent'}.
-            Use the registered functions to complete the assigned task. When you finish, respond with:
-            FINAL: <concise summary of the findings or answer>.
-            """
-        ).strip()
+        system_message = _SYSTEM_TMPL.format(
+            name=agent_spec.name,
+            description=agent_spec.description or "General agent",
+        )
         assistant = AssistantAgent(
-            name=f"{agent_spec.name}_{task_id}",
+            name=agent_spec.name,
             llm_config={
                 "timeout": llm_params.get("timeout", 120),
                 "config_list": config_list,
@@ -326,21 +464,21 @@ class AutogenOrchestrator:
             assistant.register_function(
                 {
                     "name": tool_name,
-                    "description": tool.description or tool_name,
+                    "description": compact_description(tool.description or tool_name),
                     "parameters": {
                         "type": "object",
                         "properties": {
                             "input_text": {"type": "string"},
                         },
                     },
-                    "function": self._wrap_tool(tool_name, tool, agent_spec.name, task_id),
+                    "function": self._wrap_tool(tool_name, tool, agent_spec.name, binding),
                 }
             )
         return assistant
 
-    def _build_user(self, task_id: str) -> UserProxyAgent:
+    def _build_user(self) -> UserProxyAgent:
         return UserProxyAgent(
-            name=f"{task_id}_runner",
+            name="agx_runner",
             human_input_mode="NEVER",
             code_execution_config=False,
             is_termination_msg=self._is_final_message,
@@ -351,8 +489,9 @@ class AutogenOrchestrator:
         params.update(agent_spec.llm_params)
         return params
 
-    def _wrap_tool(self, name: str, tool, agent_name: str, task_id: str):
+    def _wrap_tool(self, name: str, tool, agent_name: str, binding: Dict[str, str]):
         def _tool_func(input_text: Any = "", **kwargs: Any) -> str:
+            task_id = binding["task_id"]
             payload = self._format_tool_input(input_text, kwargs)
             self.integrations.emit(
                 {
@@ -386,7 +525,7 @@ class AutogenOrchestrator:
             data["input"] = input_text
         if extra:
             data.update(extra)
-        return json.dumps(data)
+        return json.dumps(data, separators=(",", ":"))
 
     def _build_task_prompt(self, task_spec, agent_spec: AgentSpec) -> str:
         if agent_spec.self_deciding:
@@ -402,16 +541,12 @@ class AutogenOrchestrator:
                 "If no actions are needed, return an empty proposed_actions array."
             )
         task_input = self._format_task_input(task_spec.input)
-        return textwrap.dedent(
-            f"""
-            Task: {task_spec.description}
-            Task Input (JSON if available): {task_input}
-            Expected tools: {agent_spec.tools}
-            Behavior: {behavior}
-            Follow the workflow, calling registered functions by name.
-            When completed, respond with 'FINAL: <summary>'.
-            """
-        ).strip()
+        return _TASK_TMPL.format(
+            description=task_spec.description,
+            task_input=task_input,
+            tools=agent_spec.tools,
+            behavior=behavior,
+        )
 
     def _format_task_input(self, value: Any) -> str:
         if isinstance(value, (dict, list)):
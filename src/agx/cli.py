@@ -12,15 +12,8 @@ import urllib.request
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .agents.orchestrator import Orchestrator
-from .autogen_runner import AutogenOrchestrator
 from .config import ProjectConfig
-from .remote_worker import discover_worker_agents, execute_remote_task
-from .tasks.base import TaskState
-from .tasks.runner import TaskRunner
 from .workspace import resolve_workspace_paths
 
 app = typer.Typer(help="AGX framework CLI")
@@ -28,6 +21,8 @@ console = Console()
 
 
 def _render_plan(config: ProjectConfig) -> None:
+    from rich.table import Table
+
     plan = Table(title="Execution Plan", show_lines=True)
     plan.add_column("Task ID")
     plan.add_column("Agent")
@@ -42,9 +37,21 @@ def run(
     config_path: Path = typer.Argument(..., help="Path to YAML configuration"),
     show_trace: bool = False,
     engine: str = typer.Option("autogen", help="Engine to use: autogen or legacy"),
+    concurrency: int = typer.Option(1, help="Maximum number of independent tasks to run at once"),
+    output_format: str = typer.Option(
+        "table", "--format", help="Task output format: table, or plain to skip Rich layout for large results"
+    ),
 ) -> None:
     """Execute the tasks described in the given config file."""
 
+    if output_format not in ("table", "plain"):
+        raise typer.BadParameter("must be 'table' or 'plain'", param_hint="--format")
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    from .tasks.base import TaskState
+
     config = ProjectConfig.from_file(str(config_path))
     console.print(f"[bold green]Running project[/] {config.name} (engine={engine})")
     _render_plan(config)
@@ -68,10 +75,16 @@ def run(
     approval_callback = approval_prompt if interactive else None
 
     if engine == "legacy":
-        orchestrator = Orchestrator(config)
+        from .agents.orchestrator import Orchestrator
+
+        orchestrator = Orchestrator(config, max_workers=concurrency)
         orchestrator.runner._approval_callback = approval_callback
     else:
-        orchestrator = AutogenOrchestrator(config, approval_callback=approval_callback)
+        from .autogen_runner import AutogenOrchestrator
+
+        orchestrator = AutogenOrchestrator(
+            config, approval_callback=approval_callback, max_workers=concurrency
+        )
 
     with progress:
         progress_tasks = {
@@ -100,12 +113,16 @@ def run(
                     status = "[yellow]waiting for approval"
                 progress.update(progress_tasks[task_id], status=status)
 
-    table = Table(title="Task outputs", show_lines=True)
-    table.add_column("Task ID")
-    table.add_column("Output")
-    for task_id, output in results.items():
-        table.add_row(task_id, output)
-    console.print(table)
+    if output_format == "plain":
+        for task_id, output in results.items():
+            typer.echo(f"[{task_id}]\n{output}")
+    else:
+        table = Table(title="Task outputs", show_lines=True)
+        table.add_column("Task ID")
+        table.add_column("Output")
+        for task_id, output in results.items():
+            table.add_row(task_id, output)
+        console.print(table)
 
     if show_trace and engine == "legacy":
         for task in orchestrator.tasks:
@@ -120,18 +137,28 @@ def run(
 
 
 @app.command()
-def inspect(config_path: Path = typer.Argument(..., help="Config to inspect")) -> None:
+def inspect(
+    config_path: Path = typer.Argument(..., help="Config to inspect"),
+    header_only: bool = typer.Option(False, "--header-only", help="Only print the project name and description"),
+) -> None:
     """Print the agents, tasks, and tools defined by a configuration file."""
 
+    if header_only:
+        header = ProjectConfig.peek(config_path)
+        console.print(f"[bold]Project:[/] {header['name']}\n{header['description'] or ''}")
+        return
+
+    from .agents.orchestrator import Orchestrator
+
     config = ProjectConfig.from_file(str(config_path))
-    orchestrator = Orchestrator(config)
+    summary = Orchestrator.describe(config)
     console.print(f"[bold]Project:[/] {config.name}\n{config.description or ''}")
     console.print("[bold]Agents[/]")
-    for agent in orchestrator.agents.values():
-        console.print(f"- {agent.name}: tools={[name for name in agent.tools.keys()]}")
+    for agent in summary["agents"]:
+        console.print(f"- {agent['name']}: tools={agent['tools']}")
     console.print("[bold]Tasks[/]")
-    for task in orchestrator.tasks:
-        console.print(f"- {task.id} -> {task.agent_name}: {task.description}")
+    for task in summary["tasks"]:
+        console.print(f"- {task['id']} -> {task['agent']}: {task['description']}")
 
 @app.command()
 def worker(
@@ -145,6 +172,8 @@ def worker(
 ) -> None:
     """Run this CLI as a remote AGX worker."""
 
+    from .remote_worker import discover_worker_agents, execute_remote_task
+
     base_url = runtime_url.rstrip("/")
     workspace = resolve_workspace_paths(Path.cwd())
     resolved_agents_dir = (agents_dir or workspace.agents_dir).expanduser().resolve()
@@ -2,25 +2,33 @@
 
 from __future__ import annotations
 
+import copy
 import importlib
 import pathlib
 from dataclasses import dataclass, field
+from functools import lru_cache
+from sys import intern
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
 
-import yaml
-
 
 class ConfigError(RuntimeError):
     """Raised when configuration files are invalid."""
 
 
-@dataclass
+def _opt_dict(value: Mapping[str, Any] | None) -> Dict[str, Any]:
+    """Copy an optional sub-mapping, allocating a single dict when it is absent or empty."""
+
+    return dict(value) if value else {}
+
+
+@dataclass(slots=True)
 class PlanningSpec:
     """Runtime planning parameters for an agent."""
 
     max_iterations: int = 4
     reflection: bool = False
     allow_parallel: bool = False
+    cache: bool = False
 
     @classmethod
     def from_mapping(cls, data: Optional[Mapping[str, Any]]) -> "PlanningSpec":
@@ -30,10 +38,11 @@ class PlanningSpec:
             max_iterations=int(data.get("max_iterations", 4)),
             reflection=bool(data.get("reflection", False)),
             allow_parallel=bool(data.get("allow_parallel", False)),
+            cache=bool(data.get("cache", False)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MemorySpec:
     """Memory backend configuration."""
 
@@ -46,7 +55,7 @@ class MemorySpec:
             return cls()
         return cls(
             type=data.get("type", cls.type_default()),
-            params=dict(data.get("params", {})),
+            params=_opt_dict(data.get("params")),
         )
 
     @staticmethod
@@ -54,7 +63,7 @@ class MemorySpec:
         return "agx.memory.simple:ConversationBufferMemory"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSpec:
     """Definition of an agent from config."""
 
@@ -73,19 +82,19 @@ class AgentSpec:
         if "tools" not in data:
             raise ConfigError(f"Agent '{name}' requires a tools list")
         return cls(
-            name=name,
+            name=intern(str(name)),
             llm_provider=data.get("llm_provider"),
-            tools=list(data.get("tools", [])),
+            tools=[intern(str(tool)) for tool in data.get("tools", [])],
             planning=PlanningSpec.from_mapping(data.get("planning")),
             description=data.get("description"),
             memory=MemorySpec.from_mapping(data.get("memory")),
-            metadata=dict(data.get("metadata", {})),
-            llm_params=dict(data.get("llm_params", {})),
+            metadata=_opt_dict(data.get("metadata")),
+            llm_params=_opt_dict(data.get("llm_params")),
             self_deciding=bool(data.get("self_deciding", False)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskSpec:
     """Represents a task to be executed by an agent."""
 
@@ -109,10 +118,11 @@ class TaskSpec:
         if missing:
             raise ConfigError(f"Task is missing required keys: {', '.join(missing)}")
         raw_depends = data.get("depends_on") or []
+        # Identifiers are interned: they repeat across tasks and key every lookup.
         if isinstance(raw_depends, str):
-            depends_on = [raw_depends]
+            depends_on = [intern(raw_depends)]
         else:
-            depends_on = [str(item) for item in raw_depends]
+            depends_on = [intern(str(item)) for item in raw_depends]
         task_type = data.get("type") or data.get("task_type")
         if isinstance(task_type, str):
             normalized = task_type.strip().lower()
@@ -129,23 +139,23 @@ class TaskSpec:
         else:
             task_type = None
         return cls(
-            id=str(data["id"]),
-            agent=str(data["agent"]),
+            id=intern(str(data["id"])),
+            agent=intern(str(data["agent"])),
             description=str(data["description"]),
             input=data.get("input"),
-            context=dict(data.get("context", {})),
+            context=_opt_dict(data.get("context")),
             expected_output=data.get("expected_output"),
             depends_on=depends_on,
             task_type=task_type,
             reason=data.get("reason"),
-            ui=(dict(data.get("ui", {})) if isinstance(data.get("ui"), Mapping) else None),
-            tool=(str(data.get("tool")) if data.get("tool") is not None else None),
-            source_task=(str(data.get("source_task")) if data.get("source_task") is not None else None),
+            ui=(dict(data["ui"]) if isinstance(data.get("ui"), Mapping) else None),
+            tool=(intern(str(data.get("tool"))) if data.get("tool") is not None else None),
+            source_task=(intern(str(data.get("source_task"))) if data.get("source_task") is not None else None),
             continue_on_error=bool(data.get("continue_on_error", False)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolSpec:
     """Configuration for a tool instance."""
 
@@ -157,10 +167,10 @@ class ToolSpec:
     def from_mapping(cls, name: str, data: Mapping[str, Any]) -> "ToolSpec":
         if "type" not in data:
             raise ConfigError(f"Tool '{name}' requires a type path")
-        return cls(name=name, type=str(data["type"]), args=dict(data.get("args", {})))
+        return cls(name=intern(str(name)), type=intern(str(data["type"])), args=_opt_dict(data.get("args")))
 
 
-@dataclass
+@dataclass(slots=True)
 class DefaultsSpec:
     """Optional defaults applied to agents/tasks."""
 
@@ -175,13 +185,13 @@ class DefaultsSpec:
             return cls()
         return cls(
             llm_provider=data.get("llm_provider"),
-            llm_params=dict(data.get("llm_params", {})),
-            middleware=dict(data.get("middleware", {})),
-            observability=dict(data.get("observability", {})),
+            llm_params=_opt_dict(data.get("llm_params")),
+            middleware=_opt_dict(data.get("middleware")),
+            observability=_opt_dict(data.get("observability")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Representation of the YAML configuration."""
 
@@ -196,14 +206,15 @@ class ProjectConfig:
     @classmethod
     def from_file(cls, path: str | pathlib.Path) -> "ProjectConfig":
         p = pathlib.Path(path)
-        data = yaml.safe_load(p.read_text())
-        if not isinstance(data, MutableMapping):
-            raise ConfigError("Configuration root must be a mapping")
-        return cls.from_mapping(data, p)
+        stat = p.stat()
+        # Callers mutate task specs (input/context), so hand out a private copy.
+        config = copy.deepcopy(_load_config_file(p.resolve(), stat.st_mtime_ns, stat.st_size))
+        config.file_path = p
+        return config
 
     @classmethod
     def from_yaml(cls, content: str) -> "ProjectConfig":
-        data = yaml.safe_load(content)
+        data = _load_yaml(content)
         if not isinstance(data, MutableMapping):
             raise ConfigError("Configuration root must be a mapping")
         return cls.from_mapping(data)
@@ -233,6 +244,19 @@ class ProjectConfig:
             file_path=path,
         )
 
+    @staticmethod
+    def peek(path: str | pathlib.Path) -> Dict[str, Optional[str]]:
+        """Return the top-level ``name`` and ``description`` without a full parse.
+
+        Parsing stops as soon as both keys have been seen, so agents and tasks
+        listed after them are never constructed.
+        """
+
+        p = pathlib.Path(path)
+        with p.open("rb") as stream:
+            header = _peek_header(stream, ("name", "description"))
+        return {"name": header.get("name", p.stem), "description": header.get("description")}
+
     def get_agent(self, name: str) -> AgentSpec:
         try:
             return self.agents[name]
@@ -240,8 +264,63 @@ class ProjectConfig:
             raise ConfigError(f"Unknown agent '{name}' referenced by task") from exc
 
 
+def _load_yaml(source: str | bytes) -> Any:
+    # Imported lazily so CLI paths that never read a config skip PyYAML; the
+    # libyaml-backed loader keeps yaml.safe_load semantics when available.
+    import yaml
+
+    return yaml.load(source, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _peek_header(stream: Any, keys: Iterable[str]) -> Dict[str, str]:
+    """Collect scalar values of top-level ``keys`` from a YAML event stream."""
+
+    import yaml
+
+    wanted = set(keys)
+    found: Dict[str, str] = {}
+    depth = 0
+    key: Optional[str] = None
+    for event in yaml.parse(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            if depth == 0 and not isinstance(event, yaml.MappingStartEvent):
+                break
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+            if depth == 0:
+                break
+            if depth == 1:
+                key = None
+        elif depth == 1 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+            if key is None:
+                key = getattr(event, "value", None) or ""
+                continue
+            if key in wanted and isinstance(event, yaml.ScalarEvent):
+                found[key] = event.value
+                if len(found) == len(wanted):
+                    break
+            key = None
+    return found
+
+
+@lru_cache(maxsize=32)
+def _load_config_file(path: pathlib.Path, mtime_ns: int, size: int) -> ProjectConfig:
+    """Parse ``path``; the stat fields in the key invalidate entries on edit."""
+
+    data = _load_yaml(path.read_bytes())
+    if not isinstance(data, MutableMapping):
+        raise ConfigError("Configuration root must be a mapping")
+    return ProjectConfig.from_mapping(data, path)
+
+
+@lru_cache(maxsize=256)
 def import_string(path: str) -> Any:
-    """Return attribute from module specified by path "module:qualname"."""
+    """Return attribute from module specified by path "module:qualname".
+
+    Results are memoised per path so repeated orchestrator builds resolve
+    providers, memories, and tools with a dict lookup.
+    """
 
     if ":" not in path:
         raise ConfigError(f"Import path '{path}' must use module:qualname format")
@@ -1,5 +1,6 @@
 """LLM provider interfaces."""
 
+from .cache import LLMCache
 from .provider import (
     ConsoleEchoProvider,
     LLMProvider,
@@ -9,6 +10,7 @@ from .provider import (
 )
 
 __all__ = [
+    "LLMCache",
     "LLMProvider",
     "PromptContext",
     "ConsoleEchoProvider",
@@ -0,0 +1,113 @@
+"""Response cache for deterministic LLM calls."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .provider import PromptContext
+
+
+def cache_key(provider: Any, prompt: str, context: PromptContext) -> str:
+    """Return a stable SHA-256 key for a provider/prompt pair.
+
+    Covers everything that shapes the request, so editing a provider's system
+    prompt or pointing it at another host does not replay stale responses.
+    """
+
+    material = {
+        "prov": f"{type(provider).__module__}.{type(provider).__qualname__}",
+        "model": getattr(provider, "model", None),
+        "options": getattr(provider, "options", None),
+        "system": getattr(provider, "system_prompt", None),
+        "host": getattr(provider, "host", None),
+        "ctx": asdict(context),
+        "p": prompt,
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class LLMCache:
+    """In-process LRU in front of an optional SQLite file keyed by prompt hash."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        *,
+        max_items: int = 256,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.db_path = db_path
+        self.max_items = max_items
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL, ts REAL NOT NULL)"
+                )
+                conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[1], now):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        entry = self._read_disk(key)
+        if entry is None or self._expired(entry[1], now):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self._remember(key, entry)
+            self.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: str) -> None:
+        entry = (value, time.time())
+        with self._lock:
+            self._remember(key, entry)
+        if self.db_path is None:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, entry[0], entry[1]),
+            )
+            conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._memory)}
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at > self.ttl
+
+    def _remember(self, key: str, entry: tuple[str, float]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[tuple[str, float]]:
+        if self.db_path is None:
+            return None
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT response, ts FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None
+        return str(row[0]), float(row[1])
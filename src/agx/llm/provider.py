@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
-import itertools
+import http.client
 import json
-import urllib.error
-import urllib.request
+import sys
+import threading
+import urllib.parse
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Protocol
+from typing import Any, Dict, Iterable, Iterator, Protocol
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
 
-@dataclass
+_compact_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _compact_json(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class PromptContext:
     """Metadata about the prompt being generated."""
 
@@ -20,7 +40,11 @@ class PromptContext:
 
 
 class LLMProvider(Protocol):
-    """Interface for language model providers."""
+    """Interface for language model providers.
+
+    Providers may additionally implement ``stream(prompt, context)`` returning an
+    iterator of response fragments; closing that iterator should stop generation.
+    """
 
     def generate(self, prompt: str, context: PromptContext) -> str:  # pragma: no cover - interface
         """Return a response for the given prompt."""
@@ -36,35 +60,37 @@ class ConsoleEchoProvider:
         header = f"\n[{self.prefix}] {context.agent_name}:{context.task_id} iteration {context.iteration}\n"
         print(header)
         print(prompt)
-        print("Type JSON response (end with empty line):")
+        print("Type JSON response (end with empty line):", flush=True)
         lines = []
-        while True:
-            try:
-                line = input()
-            except EOFError:  # pragma: no cover - console only
-                break
-            if not line:
+        # readline returns "" at EOF, which ends the loop like the empty-line terminator.
+        for line in iter(sys.stdin.readline, ""):
+            if not line.rstrip("\r\n"):
                 break
             lines.append(line)
-        return "\n".join(lines)
+        return "".join(lines).removesuffix("\n")
 
 
 class StaticResponseProvider:
     """Provider that replays a finite list of responses (useful for tests)."""
 
     def __init__(self, responses: Iterable[str]):
-        self._responses = iter(responses)
-        self._counter = itertools.count()
+        self._responses = list(responses)
+        self._index = 0
 
     def generate(self, prompt: str, context: PromptContext) -> str:
-        try:
-            return next(self._responses)
-        except StopIteration as exc:  # pragma: no cover - debug guard
-            raise RuntimeError("StaticResponseProvider exhausted") from exc
+        index = self._index
+        if index >= len(self._responses):  # pragma: no cover - debug guard
+            raise RuntimeError("StaticResponseProvider exhausted")
+        self._index = index + 1
+        return self._responses[index]
 
 
 class OllamaProvider:
-    """Calls a locally hosted Ollama model via its HTTP API."""
+    """Calls a locally hosted Ollama model via its HTTP API.
+
+    Each thread keeps one keep-alive connection to the host and reuses it across
+    calls; a connection dropped by the server is reopened once per request.
+    """
 
     def __init__(
         self,
@@ -74,39 +100,119 @@ class OllamaProvider:
         options: Dict[str, Any] | None = None,
         system_prompt: str | None = None,
         timeout: float = 120.0,
+        stream: bool = False,
     ) -> None:
         self.model = model
         self.host = host.rstrip("/")
         self.options = options or {}
         self.system_prompt = system_prompt
         self.timeout = timeout
+        # When set, generate() reads the NDJSON stream so the socket timeout applies
+        # per fragment rather than to the whole completion.
+        self.streaming = stream
+        parts = urllib.parse.urlsplit(self.host)
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._netloc = parts.netloc
+        self._endpoint_path = f"{parts.path}/api/generate"
+        self._static_headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        self._local = threading.local()
+        self._template: Dict[str, Any] = {"model": self.model, "options": dict(self.options)}
 
     def generate(self, prompt: str, context: PromptContext) -> str:
-        payload: Dict[str, Any] = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": self.options,
-        }
-        if self.system_prompt:
-            payload["system"] = self.system_prompt.format(
-                agent=context.agent_name, task=context.task_id, iteration=context.iteration
-            )
-        request = urllib.request.Request(
-            url=f"{self.host}/api/generate",
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        if self.streaming:
+            return "".join(self.stream(prompt, context)).strip()
+        response = self._post(self._body(prompt, context, stream=False))
+        self._check_status(response)
         try:
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                body = response.read().decode("utf-8")
-        except urllib.error.URLError as exc:
+            body = response.read()
+        except (OSError, http.client.HTTPException) as exc:
+            self._drop_connection()
             raise RuntimeError(f"OllamaProvider failed to reach {self.host}: {exc}") from exc
-        data = json.loads(body)
+        if response.will_close:
+            self._drop_connection()
+        data = _loads(body)
         if "error" in data:
             raise RuntimeError(f"OllamaProvider error: {data['error']}")
         result = data.get("response")
         if not isinstance(result, str):
             raise RuntimeError(f"OllamaProvider returned unexpected payload: {data}")
         return result.strip()
+
+    def stream(self, prompt: str, context: PromptContext) -> Iterator[str]:
+        """Yield response fragments as the model produces them.
+
+        Closing the iterator early closes the HTTP connection, which stops generation.
+        """
+
+        response = self._post(self._body(prompt, context, stream=True))
+        self._check_status(response)
+        drained = False
+        try:
+            for raw in response:
+                if not raw.strip():
+                    continue
+                frame = _loads(raw)
+                if "error" in frame:
+                    raise RuntimeError(f"OllamaProvider error: {frame['error']}")
+                fragment = frame.get("response")
+                if fragment:
+                    yield fragment
+                if frame.get("done"):
+                    break
+            response.read()
+            drained = True
+        finally:
+            if not drained or response.will_close:
+                self._drop_connection()
+
+    def _body(self, prompt: str, context: PromptContext, *, stream: bool) -> bytes:
+        payload = self._template.copy()
+        payload["prompt"] = prompt
+        payload["stream"] = stream
+        if self.system_prompt:
+            payload["system"] = self.system_prompt.format(
+                agent=context.agent_name, task=context.task_id, iteration=context.iteration
+            )
+        return _dumps(payload)
+
+    def _post(self, body: bytes) -> http.client.HTTPResponse:
+        try:
+            try:
+                return self._send(body)
+            except ConnectionError:
+                # Keep-alive sockets may be closed by the server between calls; retry once.
+                self._drop_connection()
+                return self._send(body)
+        except (OSError, http.client.HTTPException) as exc:
+            self._drop_connection()
+            raise RuntimeError(f"OllamaProvider failed to reach {self.host}: {exc}") from exc
+
+    def _check_status(self, response: http.client.HTTPResponse) -> None:
+        if 200 <= response.status < 300:
+            return
+        try:
+            detail = response.read().decode("utf-8", errors="replace").strip()
+        except (OSError, http.client.HTTPException):
+            detail = ""
+        self._drop_connection()
+        raise RuntimeError(f"OllamaProvider HTTP {response.status} from {self.host}: {detail or response.reason}")
+
+    def _send(self, body: bytes) -> http.client.HTTPResponse:
+        connection = self._connection()
+        connection.request("POST", self._endpoint_path, body, self._static_headers)
+        return connection.getresponse()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connection_class(self._netloc, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def _drop_connection(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
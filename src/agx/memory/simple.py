@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import threading
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Deque, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryRecord:
     role: str
     content: str
@@ -18,15 +20,34 @@ class ConversationBufferMemory:
 
     def __init__(self, max_items: int = 20) -> None:
         self.max_items = max_items
-        self._items: List[MemoryRecord] = []
+        self._items: Deque[MemoryRecord] = deque(maxlen=max_items)
+        self._rendered_parts: Deque[str] = deque(maxlen=max_items)
+        self._rendered: str | None = None
+        # Tasks of an agent with planning.allow_parallel may share this memory across threads.
+        self._lock = threading.Lock()
 
     def add(self, role: str, content: str, metadata: Dict[str, str] | None = None) -> None:
-        self._items.append(MemoryRecord(role=role, content=content, metadata=metadata))
-        if len(self._items) > self.max_items:
-            self._items = self._items[-self.max_items :]
+        record = MemoryRecord(role=role, content=content, metadata=metadata)
+        line = f"{role}: {content}"
+        with self._lock:
+            self._items.append(record)
+            self._rendered_parts.append(line)
+            self._rendered = None
 
     def dump(self) -> List[MemoryRecord]:
-        return list(self._items)
+        with self._lock:
+            return list(self._items)
+
+    def rendered(self) -> str:
+        """Return the records as ``role: content`` lines, joined once per change."""
+
+        with self._lock:
+            if self._rendered is None:
+                self._rendered = "\n".join(self._rendered_parts)
+            return self._rendered
 
     def clear(self) -> None:
-        self._items.clear()
+        with self._lock:
+            self._items.clear()
+            self._rendered_parts.clear()
+            self._rendered = None
@@ -14,7 +14,6 @@ import yaml
 
 from .agents.manifest import normalize_manifest, validate_manifest
 from .agents.orchestrator import Orchestrator
-from .autogen_runner import AutogenOrchestrator
 from .config import ProjectConfig
 from .runtime.interoperability import parse_output_text
 from .tasks.runner import TaskRunner
@@ -124,6 +123,8 @@ def execute_remote_task(
             result = orchestrator.runner.run(task)
             output = result.output
         else:
+            from .autogen_runner import AutogenOrchestrator
+
             orchestrator = AutogenOrchestrator(config)
             output = orchestrator.run_task(spec)
     duration = time.perf_counter() - started
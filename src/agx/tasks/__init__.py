@@ -1,6 +1,6 @@
 """Task primitives."""
 
-from .base import Task, TaskResult
+from .base import HumanApprovalTask, HumanInputTask, Task, TaskResult, TaskState
 from .runner import TaskRunner
 
-__all__ = ["Task", "TaskResult", "TaskRunner"]
+__all__ = ["HumanApprovalTask", "HumanInputTask", "Task", "TaskResult", "TaskRunner", "TaskState"]
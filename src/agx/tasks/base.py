@@ -4,10 +4,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
+try:
+    from enum import StrEnum as _StrEnum
+except ImportError:  # pragma: no cover - Python 3.10
 
-class TaskState(str, Enum):
+    class _StrEnum(str, Enum):
+        def __str__(self) -> str:
+            return self.value
+
+
+class TaskState(_StrEnum):
     """Lifecycle states for tasks."""
 
     PENDING = "PENDING"
@@ -17,7 +25,11 @@ class TaskState(str, Enum):
     WAITING_HUMAN = "WAITING_HUMAN"
 
 
-@dataclass
+_COMPLETED = TaskState.COMPLETED
+_FAILED = TaskState.FAILED
+
+
+@dataclass(slots=True)
 class Task:
     """A single unit of work for an agent."""
 
@@ -32,23 +44,28 @@ class Task:
     source_task: Optional[str] = None
     tool: Optional[str] = None
     continue_on_error: bool = False
+    deps: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Set view of depends_on for the scheduler's readiness checks.
+        self.deps = frozenset(self.depends_on or ())
 
 
-@dataclass
+@dataclass(slots=True)
 class HumanApprovalTask(Task):
     """Task that blocks until a human approves continuation."""
 
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class HumanInputTask(Task):
     """Task that blocks until a human provides input."""
 
     ui: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of executing a task."""
 
@@ -62,4 +79,4 @@ class TaskResult:
 
     def __post_init__(self) -> None:
         if self.state is None:
-            self.state = TaskState.COMPLETED if self.success else TaskState.FAILED
+            self.state = _COMPLETED if self.success else _FAILED
@@ -2,18 +2,143 @@
 
 from __future__ import annotations
 
+import atexit
+import heapq
 import json
+import os
+import queue
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
 
 from ..runtime.integrations import RuntimeIntegrations, build_runtime_integrations
 from ..runtime.interoperability import build_handoff_payload, parse_output_text, resolve_bindings
 from .base import HumanApprovalTask, HumanInputTask, Task, TaskResult, TaskState
 
 
+def _dump_trace(trace: List[str]) -> str:
+    # Always JSON TEXT, so any process can read the DB whatever optional packages it has.
+    if orjson is not None:
+        return orjson.dumps(trace).decode("utf-8")
+    return json.dumps(trace)
+
+
+def _load_trace(data: str) -> List[str]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _find_cycles(nodes: Sequence[str], edges: Dict[str, List[str]]) -> List[List[str]]:
+    """Return every dependency cycle among ``nodes`` (Tarjan's SCC, iteratively).
+
+    ``edges`` must be closed over ``nodes``. Each cycle is a strongly connected
+    component of two or more tasks, or a task that depends on itself; both the
+    cycles and their members follow the order of ``nodes``.
+    """
+
+    position = {node: index for index, node in enumerate(nodes)}
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    cycles: List[List[str]] = []
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges[root]))]
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = low[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(edges[succ])))
+                    break
+                if succ in on_stack:
+                    low[node] = min(low[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] != index[node]:
+                    continue
+                component: List[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in edges[node]:
+                    cycles.append(sorted(component, key=position.__getitem__))
+    cycles.sort(key=lambda cycle: position[cycle[0]])
+    return cycles
+
+
+def resolve_max_workers(agent_specs: Iterable[Any], requested: int = 1) -> int:
+    """Return how many tasks a run may execute at once.
+
+    An explicit ``requested`` above one wins. Otherwise any agent that sets
+    ``planning.allow_parallel`` enables a pool sized like ThreadPoolExecutor's default.
+    """
+
+    if requested > 1:
+        return requested
+    if any(spec.planning.allow_parallel for spec in agent_specs):
+        return min(32, (os.cpu_count() or 1) + 4)
+    return 1
+
+
+def resolve_parallel_agents(agent_specs: Iterable[Any], requested: int = 1) -> Optional[FrozenSet[str]]:
+    """Return the agents whose tasks may run concurrently, or None for every agent.
+
+    An explicit ``requested`` above one opts every agent in. Otherwise only agents
+    that set ``planning.allow_parallel`` fan out; the rest (console prompts, shared
+    static providers) keep running one task at a time.
+    """
+
+    if requested > 1:
+        return None
+    return frozenset(spec.name for spec in agent_specs if spec.planning.allow_parallel)
+
+
+_SCHEMA_VERSION = 3
+
+_UPSERT_SQL = """
+    INSERT INTO task_runs (task_id, state, output, iterations, trace, error, reason, approved, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(task_id) DO UPDATE SET
+        state=excluded.state,
+        output=excluded.output,
+        iterations=excluded.iterations,
+        trace=excluded.trace,
+        error=excluded.error,
+        reason=excluded.reason,
+        approved=excluded.approved,
+        updated_at=excluded.updated_at
+"""
+
+# Stays under SQLITE_MAX_VARIABLE_NUMBER on builds older than 3.32 (999).
+_FETCH_BATCH = 500
+
+
 @dataclass
 class TaskStateRecord:
     task_id: str
@@ -27,86 +152,197 @@ class TaskStateRecord:
     updated_at: Optional[str] = None
 
 
+_STOP_WRITER = object()
+
+
 class TaskStateStore:
     """SQLite-backed persistence for task state."""
 
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection for the store's lifetime, shared by worker threads under
+        # a lock, instead of reconnecting on every read and write.
+        self._conn = self._open()
+        self._lock = threading.Lock()
         self._ensure_schema()
-
-    def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        # Upserts are queued for one long-lived writer thread that commits
+        # whatever has piled up as a single batch; reads flush first.
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._retry: List[Tuple[Any, ...]] = []
+        self._write_error: Optional[Exception] = None
+        self._error_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(target=self._drain, name="agx-task-state-writer", daemon=True)
+        self._writer.start()
+        # Daemon so an unclosed store cannot hang interpreter exit; queued rows
+        # are still committed by the exit hook.
+        atexit.register(self.close)
+
+    def _open(self) -> sqlite3.Connection:
+        # WAL (set once in _ensure_schema) lets commits append to the log; with
+        # synchronous=NORMAL they no longer fsync on every state transition. The
+        # larger statement cache keeps the upsert prepared even as fetch_many adds
+        # one IN-list statement per distinct batch size.
+        conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        try:
+            self.flush()
+        finally:
+            self._queue.put(_STOP_WRITER)
+            self._writer.join()
+            with self._lock:
+                self._conn.close()
+
+    def flush(self) -> None:
+        """Wait until queued writes are committed, re-raising a failed write.
+
+        Rows from a failed batch are kept by the writer and retried with the
+        next batch, which a flush also starts.
+        """
+
+        while True:
+            self._queue.join()
+            self._raise_write_error()
+            if not self._retry:
+                return
+            self._queue.put(())
+
+    def _enqueue(self, rows: Sequence[Tuple[Any, ...]]) -> None:
+        self._queue.put(rows)
+        # Report an earlier failed batch to the next writer rather than
+        # leaving it for a flush that direct callers may never make.
+        self._raise_write_error()
+
+    def _raise_write_error(self) -> None:
+        with self._error_lock:
+            error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def _drain(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _STOP_WRITER in items
+            rows = self._retry + [row for item in items if item is not _STOP_WRITER for row in item]
+            if rows:
+                try:
+                    with self._lock, self._conn as conn:
+                        conn.executemany(_UPSERT_SQL, rows)
+                except Exception as exc:
+                    # Keep the batch ahead of newer rows; the error is raised by
+                    # the next flush or upsert, and the rows go with the next batch.
+                    self._retry = rows
+                    with self._error_lock:
+                        self._write_error = exc
+                else:
+                    self._retry = []
+            for _ in items:
+                self._queue.task_done()
+            if stop:
+                return
 
     def _ensure_schema(self) -> None:
-        with self._connect() as conn:
-            cur = conn.execute("PRAGMA user_version")
-            version = int(cur.fetchone()[0])
-            if version == 0:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS task_runs (
-                        task_id TEXT PRIMARY KEY,
-                        state TEXT NOT NULL,
-                        output TEXT,
-                        iterations INTEGER,
-                        trace TEXT,
-                        error TEXT,
-                        updated_at TEXT NOT NULL
-                    )
-                    """
-                )
-                conn.execute("PRAGMA user_version = 1")
-                version = 1
-            if version == 1:
-                conn.execute("ALTER TABLE task_runs ADD COLUMN reason TEXT")
-                conn.execute("ALTER TABLE task_runs ADD COLUMN approved INTEGER")
-                conn.execute("PRAGMA user_version = 2")
+        with self._lock:
+            conn = self._conn
+            conn.execute("PRAGMA journal_mode=WAL")
+            if int(conn.execute("PRAGMA user_version").fetchone()[0]) == _SCHEMA_VERSION:
+                return
+            # Migrate under the write lock so two stores opening the same file
+            # cannot both apply a step; re-read the version once we hold it.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._migrate(conn, int(conn.execute("PRAGMA user_version").fetchone()[0]))
+            except BaseException:
+                conn.rollback()
+                raise
             conn.commit()
 
-    def upsert(self, record: TaskStateRecord) -> None:
-        updated_at = record.updated_at or datetime.now(timezone.utc).isoformat()
-        trace_json = json.dumps(record.trace) if record.trace is not None else None
-        approved_value = None if record.approved is None else int(record.approved)
-        with self._connect() as conn:
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection, version: int) -> None:
+        if version == 0:
             conn.execute(
                 """
-                INSERT INTO task_runs (task_id, state, output, iterations, trace, error, reason, approved, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(task_id) DO UPDATE SET
-                    state=excluded.state,
-                    output=excluded.output,
-                    iterations=excluded.iterations,
-                    trace=excluded.trace,
-                    error=excluded.error,
-                    reason=excluded.reason,
-                    approved=excluded.approved,
-                    updated_at=excluded.updated_at
-                """,
-                (
-                    record.task_id,
-                    record.state.value,
-                    record.output,
-                    record.iterations,
-                    trace_json,
-                    record.error,
-                    record.reason,
-                    approved_value,
-                    updated_at,
-                ),
+                CREATE TABLE IF NOT EXISTS task_runs (
+                    task_id TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    output TEXT,
+                    iterations INTEGER,
+                    trace TEXT,
+                    error TEXT,
+                    updated_at TEXT NOT NULL
+                )
+                """
             )
-            conn.commit()
+            conn.execute("PRAGMA user_version = 1")
+            version = 1
+        if version == 1:
+            conn.execute("ALTER TABLE task_runs ADD COLUMN reason TEXT")
+            conn.execute("ALTER TABLE task_runs ADD COLUMN approved INTEGER")
+            conn.execute("PRAGMA user_version = 2")
+            version = 2
+        if version == 2:
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_task_runs_state ON task_runs(state, updated_at)")
+            conn.execute("PRAGMA user_version = 3")
+
+    def upsert(self, record: TaskStateRecord) -> None:
+        # The row (timestamp, trace encoding) is built on the caller's thread;
+        # the writer only binds and commits it.
+        self._enqueue([self._row(record)])
+
+    def upsert_many(self, records: Sequence[TaskStateRecord], updated_at: Optional[str] = None) -> None:
+        """Queue several records; the writer commits them in one transaction.
+
+        Records without their own ``updated_at`` share one timestamp, ``updated_at``
+        if given, else the time of the call.
+        """
+
+        if not records:
+            return
+        now = updated_at or datetime.now(timezone.utc).isoformat()
+        self._enqueue([self._row(record, now) for record in records])
+
+    @staticmethod
+    def _row(record: TaskStateRecord, now: Optional[str] = None) -> Tuple[Any, ...]:
+        updated_at = record.updated_at or now or datetime.now(timezone.utc).isoformat()
+        trace_json = _dump_trace(record.trace) if record.trace is not None else None
+        approved_value = None if record.approved is None else int(record.approved)
+        return (
+            record.task_id,
+            record.state.value,
+            record.output,
+            record.iterations,
+            trace_json,
+            record.error,
+            record.reason,
+            approved_value,
+            updated_at,
+        )
 
     def fetch(self, task_id: str) -> Optional[TaskStateRecord]:
-        with self._connect() as conn:
-            cur = conn.execute(
+        self.flush()
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT task_id, state, output, iterations, trace, error, reason, approved, updated_at FROM task_runs WHERE task_id = ?",
                 (task_id,),
-            )
-            row = cur.fetchone()
+            ).fetchone()
         if not row:
             return None
-        trace = json.loads(row[4]) if row[4] else None
+        trace = _load_trace(row[4]) if row[4] else None
         return TaskStateRecord(
             task_id=row[0],
             state=TaskState(row[1]),
@@ -119,18 +355,76 @@ class TaskStateStore:
             updated_at=row[8],
         )
 
-    def set_approval(self, task_id: str, approved: bool, reason: Optional[str] = None) -> None:
-        record = self.fetch(task_id)
-        state = record.state if record else TaskState.WAITING_HUMAN
-        self.upsert(
-            TaskStateRecord(
-                task_id=task_id,
-                state=state,
-                approved=approved,
-                reason=reason if reason is not None else (record.reason if record else None),
+    def fetch_light(self, task_id: str) -> Optional[TaskStateRecord]:
+        """Like ``fetch`` but leaves ``iterations``, ``trace`` and ``error`` unread."""
+
+        self.flush()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT task_id, state, output, reason, approved, updated_at FROM task_runs WHERE task_id = ?",
+                (task_id,),
+            ).fetchone()
+        return self._light_record(row) if row else None
+
+    def fetch_many(self, task_ids: Sequence[str]) -> Dict[str, TaskStateRecord]:
+        """Return light records for the stored ``task_ids``, read in batched SELECTs."""
+
+        queries = []
+        for start in range(0, len(task_ids), _FETCH_BATCH):
+            batch = task_ids[start : start + _FETCH_BATCH]
+            sql = (
+                "SELECT task_id, state, output, reason, approved, updated_at FROM task_runs "
+                f"WHERE task_id IN ({','.join('?' * len(batch))})"
             )
+            queries.append((sql, batch))
+        rows: List[Tuple[Any, ...]] = []
+        self.flush()
+        with self._lock:
+            for sql, batch in queries:
+                rows.extend(self._conn.execute(sql, batch).fetchall())
+        return {row[0]: self._light_record(row) for row in rows}
+
+    def fetch_by_state(self, state: TaskState) -> List[TaskStateRecord]:
+        """Return light records for every task in ``state``, oldest update first."""
+
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_id, state, output, reason, approved, updated_at FROM task_runs "
+                "WHERE state = ? ORDER BY updated_at",
+                (state.value,),
+            ).fetchall()
+        return [self._light_record(row) for row in rows]
+
+    @staticmethod
+    def _light_record(row: Tuple[Any, ...]) -> TaskStateRecord:
+        return TaskStateRecord(
+            task_id=row[0],
+            state=TaskState(row[1]),
+            output=row[2],
+            reason=row[3],
+            approved=(bool(row[4]) if row[4] is not None else None),
+            updated_at=row[5],
         )
 
+    def set_approval(self, task_id: str, approved: bool, reason: Optional[str] = None) -> None:
+        # One statement: a missing row starts out waiting on a human, an existing
+        # row keeps its state and, unless a new reason is given, its reason.
+        updated_at = datetime.now(timezone.utc).isoformat()
+        self.flush()
+        with self._lock, self._conn as conn:
+            conn.execute(
+                """
+                INSERT INTO task_runs (task_id, state, reason, approved, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    approved=excluded.approved,
+                    reason=COALESCE(excluded.reason, task_runs.reason),
+                    updated_at=excluded.updated_at
+                """,
+                (task_id, TaskState.WAITING_HUMAN.value, reason, int(approved), updated_at),
+            )
+
 
 class TaskRunner:
     """Executes tasks by dispatching them to the correct agent."""
@@ -141,56 +435,98 @@ class TaskRunner:
         db_path: Optional[Path] = None,
         approval_callback: Optional[Callable[[HumanApprovalTask], Optional[bool]]] = None,
         integrations: Optional[RuntimeIntegrations] = None,
+        max_workers: int = 1,
+        parallel_agents: Optional[Iterable[str]] = None,
     ):
         self._resolver = agent_resolver
+        self._max_workers = max(1, int(max_workers))
+        # Agents whose tasks may share the pool; None lets every agent fan out.
+        self._parallel_agents = None if parallel_agents is None else frozenset(parallel_agents)
         self._results: Dict[str, TaskResult] = {}
+        self._results_view: Mapping[str, TaskResult] = MappingProxyType(self._results)
         self._store = TaskStateStore(
             db_path if db_path is not None else Path(".agx") / "task_state.db"
         )
         self._approval_callback = approval_callback
         self._integrations = integrations or build_runtime_integrations()
+        # Rows this runner has read or written, so a task's state is not
+        # re-read from SQLite after the runner already knows it.
+        self._records: Dict[str, Optional[TaskStateRecord]] = {}
 
     def approve(self, task_id: str, approved: bool, reason: Optional[str] = None) -> None:
         self._store.set_approval(task_id, approved, reason=reason)
+        self._records.pop(task_id, None)
+
+    def _record(self, task_id: str) -> Optional[TaskStateRecord]:
+        try:
+            return self._records[task_id]
+        except KeyError:
+            record = self._records[task_id] = self._store.fetch_light(task_id)
+            return record
+
+    def _save(self, record: TaskStateRecord) -> None:
+        self._store.upsert(record)
+        self._records[record.task_id] = record
+
+    def _save_many(self, records: Sequence[TaskStateRecord]) -> None:
+        self._store.upsert_many(records)
+        for record in records:
+            self._records[record.task_id] = record
 
     @staticmethod
-    def order_tasks(tasks: Sequence[object]) -> List[object]:
-        """Return tasks ordered by dependencies (topological sort)."""
-        task_map = {getattr(task, "id"): task for task in tasks}
-        deps_map: Dict[str, List[str]] = {}
+    def order_tasks(tasks: Sequence[Any]) -> List[Any]:
+        """Return tasks ordered by dependencies (topological sort).
+
+        Uses Kahn's algorithm. Among ready tasks the earliest-declared runs first,
+        so a config that already lists dependencies before dependents keeps its order.
+        """
+        task_map = {task.id: task for task in tasks}
+        position = {task_id: index for index, task_id in enumerate(task_map)}
+        indegree: Dict[str, int] = dict.fromkeys(task_map, 0)
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in task_map}
+        # Works on Task and TaskSpec alike; both declare ``id`` and ``depends_on``.
         for task in tasks:
-            raw_deps = getattr(task, "depends_on", []) or []
-            deps = [str(dep) for dep in raw_deps]
-            deps_map[getattr(task, "id")] = deps
+            task_id = task.id
+            deps = [str(dep) for dep in task.depends_on or ()]
             missing = [dep for dep in deps if dep not in task_map]
             if missing:
-                raise ValueError(f"Task {getattr(task, 'id')} depends on unknown tasks: {missing}")
-
-        ordered: List[object] = []
-        visited: Dict[str, str] = {}
-
-        def visit(task_id: str) -> None:
-            state = visited.get(task_id)
-            if state == "temp":
-                raise ValueError(f"Cyclic dependency detected at task {task_id}")
-            if state == "perm":
-                return
-            visited[task_id] = "temp"
-            for dep in deps_map.get(task_id, []):
-                visit(dep)
-            visited[task_id] = "perm"
+                raise ValueError(f"Task {task_id} depends on unknown tasks: {missing}")
+            if task_map[task_id] is not task:
+                continue
+            indegree[task_id] = len(deps)
+            for dep in deps:
+                dependents[dep].append(task_id)
+
+        ready = [position[task_id] for task_id, count in indegree.items() if count == 0]
+        heapq.heapify(ready)
+        ids = list(task_map)
+        ordered: List[Any] = []
+        while ready:
+            task_id = ids[heapq.heappop(ready)]
             ordered.append(task_map[task_id])
-
-        for task_id in task_map:
-            visit(task_id)
+            for dependent in dependents[task_id]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    heapq.heappush(ready, position[dependent])
+        if len(ordered) != len(task_map):
+            stuck = [task_id for task_id, count in indegree.items() if count > 0]
+            cycles = _find_cycles(stuck, dependents)
+            raise ValueError(f"Cyclic dependency detected at task {cycles[0][0]}; cycles={cycles}")
         return ordered
 
     def run(self, task: Task) -> TaskResult:
+        """Run a single task and wait until its state is committed."""
+
+        result = self._run_task(task)
+        self._store.flush()
+        return result
+
+    def _run_task(self, task: Task) -> TaskResult:
         if isinstance(task, HumanApprovalTask):
             return self._handle_human_task(task)
         if isinstance(task, HumanInputTask):
             return self._handle_human_input(task)
-        self._store.upsert(TaskStateRecord(task_id=task.id, state=TaskState.RUNNING))
+        self._save(TaskStateRecord(task_id=task.id, state=TaskState.RUNNING))
         agent = self._resolver(task.agent_name)
         if not hasattr(agent, "run_task"):
             raise AttributeError(f"Agent {task.agent_name} missing run_task method")
@@ -200,7 +536,7 @@ class TaskRunner:
         if result.state == TaskState.WAITING_HUMAN:
             result.success = False
         self._results[task.id] = result
-        self._store.upsert(
+        self._save(
             TaskStateRecord(
                 task_id=task.id,
                 state=result.state,
@@ -213,7 +549,7 @@ class TaskRunner:
         return result
 
     def _handle_human_task(self, task: HumanApprovalTask) -> TaskResult:
-        existing = self._store.fetch(task.id)
+        existing = self._record(task.id)
         if existing and existing.approved:
             result = TaskResult(
                 task=task,
@@ -224,7 +560,7 @@ class TaskRunner:
                 state=TaskState.COMPLETED,
             )
             self._results[task.id] = result
-            self._store.upsert(
+            self._save(
                 TaskStateRecord(
                     task_id=task.id,
                     state=TaskState.COMPLETED,
@@ -238,7 +574,7 @@ class TaskRunner:
         if self._approval_callback is not None:
             decision = self._approval_callback(task)
             if decision:
-                self._store.set_approval(task.id, True, reason=task.reason)
+                self.approve(task.id, True, reason=task.reason)
                 result = TaskResult(
                     task=task,
                     success=True,
@@ -259,7 +595,7 @@ class TaskRunner:
             state=TaskState.WAITING_HUMAN,
         )
         self._results[task.id] = result
-        self._store.upsert(
+        self._save(
             TaskStateRecord(
                 task_id=task.id,
                 state=TaskState.WAITING_HUMAN,
@@ -271,7 +607,7 @@ class TaskRunner:
         return result
 
     def _handle_human_input(self, task: HumanInputTask) -> TaskResult:
-        existing = self._store.fetch(task.id)
+        existing = self._record(task.id)
         if existing and existing.output and existing.state == TaskState.COMPLETED:
             result = TaskResult(
                 task=task,
@@ -293,7 +629,7 @@ class TaskRunner:
             state=TaskState.WAITING_HUMAN,
         )
         self._results[task.id] = result
-        self._store.upsert(
+        self._save(
             TaskStateRecord(
                 task_id=task.id,
                 state=TaskState.WAITING_HUMAN,
@@ -304,76 +640,93 @@ class TaskRunner:
         )
         return result
 
-    def run_all(self, tasks: Iterable[Task]) -> Dict[str, TaskResult]:
+    def run_all(self, tasks: Iterable[Task]) -> Mapping[str, TaskResult]:
         task_list = list(tasks)
         with self._integrations.telemetry.span(
             "agx.legacy.run_all",
             attributes={"tasks.count": len(task_list)},
         ):
-            return self._run_all_impl(task_list)
-
-    def _run_all_impl(self, tasks: Iterable[Task]) -> Dict[str, TaskResult]:
+            # One pool for the whole run, so worker threads (and the keep-alive
+            # connections providers hold per thread) outlive each wave.
+            pool = ThreadPoolExecutor(max_workers=self._max_workers) if self._max_workers > 1 else None
+            try:
+                results = self._run_all_impl(task_list, pool)
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+            # Make the run's final states durable and visible to other readers.
+            self._store.flush()
+            return results
+
+    def _run_all_impl(self, tasks: Iterable[Task], pool: Optional[ThreadPoolExecutor]) -> Mapping[str, TaskResult]:
         task_map = {task.id: task for task in tasks}
+        # Start from the database (approvals may have landed since the last run),
+        # loading every row this run needs up front.
+        self._records = dict.fromkeys(task_map)
+        self._records.update(self._store.fetch_many(list(task_map)))
         input_store: Dict[str, Dict[str, Any]] = {}
         result_store: Dict[str, Dict[str, Any]] = {}
+        pending: List[TaskStateRecord] = []
         for task in task_map.values():
             for dep in task.depends_on or []:
                 if dep not in task_map:
                     raise ValueError(f"Task {task.id} depends on unknown task {dep}")
-            existing = self._store.fetch(task.id)
+            existing = self._records[task.id]
             if existing and existing.state == TaskState.WAITING_HUMAN and not existing.approved:
                 if self._approval_callback is None:
+                    # Only the echoed result needs the trace; decode it here alone.
+                    full = self._store.fetch(task.id)
                     self._results[task.id] = TaskResult(
                         task=task,
                         success=False,
                         output=existing.output or "WAITING_HUMAN",
                         iterations=0,
-                        trace=existing.trace or [],
+                        trace=(full.trace if full else None) or [],
                         state=TaskState.WAITING_HUMAN,
                     )
                 else:
-                    self._store.upsert(TaskStateRecord(task_id=task.id, state=TaskState.PENDING))
+                    pending.append(TaskStateRecord(task_id=task.id, state=TaskState.PENDING))
             else:
-                self._store.upsert(TaskStateRecord(task_id=task.id, state=TaskState.PENDING))
+                pending.append(TaskStateRecord(task_id=task.id, state=TaskState.PENDING))
+        self._save_many(pending)
 
         states: Dict[str, TaskState] = {task_id: TaskState.PENDING for task_id in task_map}
         for task_id, result in self._results.items():
             states[task_id] = result.state or TaskState.PENDING
         remaining = set(task_map.keys())
-        while remaining:
-            ready = []
-            for task_id in remaining:
-                deps = task_map[task_id].depends_on or []
-                if all(states.get(dep) == TaskState.COMPLETED for dep in deps):
-                    ready.append(task_id)
-
-            if not ready:
-                blocked = False
-                for task_id in list(remaining):
-                    deps = task_map[task_id].depends_on or []
-                    if any(states.get(dep) == TaskState.FAILED for dep in deps):
-                        self._store.upsert(
-                            TaskStateRecord(
-                                task_id=task_id,
-                                state=TaskState.FAILED,
-                                error="dependency_failed",
-                            )
-                        )
-                        states[task_id] = TaskState.FAILED
-                        remaining.remove(task_id)
-                        blocked = True
-                    elif any(states.get(dep) == TaskState.WAITING_HUMAN for dep in deps):
-                        blocked = True
-                if blocked:
-                    break
-                raise ValueError("No runnable tasks; cyclic dependency or unresolved prerequisites.")
-
-            for task_id in ready:
-                task = task_map[task_id]
-                if not self._prepare_task(task, input_store=input_store, result_store=result_store):
+        completed = {task_id for task_id, state in states.items() if state == TaskState.COMPLETED}
+        # Kahn-style scheduling: count each task's unmet dependencies once and
+        # release dependents as their prerequisites complete, in declaration order.
+        position = {task_id: index for index, task_id in enumerate(task_map)}
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in task_map}
+        for task in task_map.values():
+            for dep in task.deps:
+                dependents[dep].append(task.id)
+        unmet = {task_id: len(task.deps - completed) for task_id, task in task_map.items()}
+        ready = [task_id for task_id in task_map if unmet[task_id] == 0]
+        prepare = partial(self._prepare_task, input_store=input_store, result_store=result_store)
+
+        def release(task_id: str) -> None:
+            if task_id in completed:
+                return
+            completed.add(task_id)
+            for dependent in dependents[task_id]:
+                unmet[dependent] -= 1
+                if unmet[dependent] == 0 and dependent in remaining:
+                    ready.append(dependent)
+
+        while ready:
+            wave = sorted(ready, key=position.__getitem__)
+            ready.clear()
+            waiting = False
+            for task, executed in self._run_wave([task_map[task_id] for task_id in wave], prepare, pool):
+                task_id = task.id
+                if not executed:
                     remaining.remove(task_id)
                     task_state = self._results[task_id].state or TaskState.FAILED
                     states[task_id] = task_state
+                    if task_state == TaskState.COMPLETED:
+                        release(task_id)
                     self._integrations.emit(
                         {
                             "type": "task_state",
@@ -383,9 +736,10 @@ class TaskRunner:
                         }
                     )
                     continue
-                self.run(task)
                 remaining.remove(task_id)
                 states[task_id] = self._results[task_id].state
+                if states[task_id] == TaskState.COMPLETED:
+                    release(task_id)
                 self._integrations.emit(
                     {
                         "type": "task_state",
@@ -400,11 +754,84 @@ class TaskRunner:
                 if isinstance(task, HumanInputTask) and isinstance(parsed, dict):
                     input_store[task_id] = parsed
                 if states[task_id] == TaskState.WAITING_HUMAN:
-                    # Stop further processing until approval.
-                    return dict(self._results)
-        return dict(self._results)
+                    waiting = True
+                    if self._max_workers == 1:
+                        break
+            if waiting:
+                # Stop further processing until approval.
+                return self._results_view
+
+        if remaining:
+            # Nothing is runnable: fail everything downstream of a failed task and
+            # leave tasks behind a pending approval for the next run.
+            cascaded: List[TaskStateRecord] = []
+            stack = [task_id for task_id, state in states.items() if state == TaskState.FAILED]
+            while stack:
+                for dependent in dependents.get(stack.pop(), ()):
+                    if dependent in remaining:
+                        remaining.remove(dependent)
+                        states[dependent] = TaskState.FAILED
+                        cascaded.append(
+                            TaskStateRecord(task_id=dependent, state=TaskState.FAILED, error="dependency_failed")
+                        )
+                        stack.append(dependent)
+            self._save_many(cascaded)
+            held = {task_id for task_id, state in states.items() if state == TaskState.WAITING_HUMAN}
+            if not cascaded and all(task_map[task_id].deps.isdisjoint(held) for task_id in remaining):
+                raise ValueError("No runnable tasks; cyclic dependency or unresolved prerequisites.")
+        return self._results_view
+
+    def _fans_out(self, task: Task) -> bool:
+        # Human tasks prompt or call back on the caller's thread.
+        if isinstance(task, (HumanApprovalTask, HumanInputTask)):
+            return False
+        return self._parallel_agents is None or task.agent_name in self._parallel_agents
+
+    def _run_wave(
+        self, tasks: List[Task], prepare: Callable[[Task], bool], pool: Optional[ThreadPoolExecutor]
+    ) -> Iterator[Tuple[Task, bool]]:
+        """Run tasks whose dependencies are satisfied.
+
+        Yields ``(task, executed)`` pairs; ``executed`` is False when ``prepare``
+        resolved the task without dispatching it to an agent. Tasks of agents that
+        opted into parallelism go to ``pool``; the rest run here, one at a time.
+        """
+
+        if pool is None:
+            for task in tasks:
+                if not prepare(task):
+                    yield task, False
+                    continue
+                self._run_task(task)
+                yield task, True
+            return
+        runnable: List[Task] = []
+        for task in tasks:
+            if not prepare(task):
+                yield task, False
+                continue
+            runnable.append(task)
+        futures = {pool.submit(self._run_task, task): task for task in runnable if self._fans_out(task)}
+        for task in runnable:
+            if self._fans_out(task):
+                continue
+            self._run_task(task)
+            yield task, True
+        finished: List[Task] = []
+        for future in as_completed(futures):
+            future.result()
+            finished.append(futures[future])
+        for task in finished:
+            yield task, True
+
+    def results(self) -> Mapping[str, TaskResult]:
+        """Return a read-only live view of the results gathered so far."""
+
+        return self._results_view
+
+    def results_snapshot(self) -> Dict[str, TaskResult]:
+        """Return a copy of the results that later runs will not change."""
 
-    def results(self) -> Dict[str, TaskResult]:
         return dict(self._results)
 
     def _prepare_task(
@@ -429,7 +856,7 @@ class TaskRunner:
                 trace=[],
                 state=TaskState.FAILED,
             )
-            self._store.upsert(
+            self._save(
                 TaskStateRecord(
                     task_id=task.id,
                     state=TaskState.FAILED,
@@ -453,7 +880,7 @@ class TaskRunner:
             trace=["agent_handoff completed"],
             state=TaskState.COMPLETED,
         )
-        self._store.upsert(
+        self._save(
             TaskStateRecord(
                 task_id=task.id,
                 state=TaskState.COMPLETED,
@@ -27,6 +27,8 @@ class ToolResult:
 class Tool:
     """Base tool class."""
 
+    __slots__ = ("name", "description", "config")
+
     name: str
     description: str
 
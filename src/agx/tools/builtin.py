@@ -2,39 +2,99 @@
 
 from __future__ import annotations
 
-import difflib
+import copy
 import json
+import mmap
 import os
 import re
 import shutil
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
-
-import yaml
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
 
 from .base import Tool, ToolContext, ToolResult
 from .registry import ToolRegistry
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
 
 
+_JSON_START = frozenset('{["-0123456789')
+_JSON_WORDS = frozenset({"true", "false", "null", "NaN", "Infinity"})
+# orjson turns integers beyond 64 bits into floats, so such payloads go to json instead.
+_LONG_DIGITS = re.compile(r"\d{20}")
+# Single-line text that YAML would hand back unchanged: starts with a letter, has no
+# ':' or '#', and is not one of YAML's bool/null words.
+_PLAIN_TEXT = re.compile(r"[A-Za-z][\w./@,;()'!?+-]*(?: +[\w./@,;()'!?+-]+)*")
+_YAML_WORDS = frozenset({"yes", "no", "on", "off", "true", "false", "null"})
+
+
+# Agent pipelines hand the same payload to several tools; YAML payloads above this
+# size (whole manifests, blobs) are parsed afresh rather than pinned in the cache.
+_YAML_CACHE_MAX_CHARS = 64 * 1024
+
+
 def _load_structured(text: Any) -> Any:
     # If the caller already passed a parsed structure (dict/list), return it as-is.
     if isinstance(text, (dict, list)):
         return text
-    # Only attempt to parse strings; non-string, non-structured inputs are returned.
-    if not isinstance(text, str):
-        return text
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+    # Only attempt to parse strings; non-string, non-structured inputs are returned.
+    if not isinstance(text, str):
+        return text
+    return _parse_structured(text)
+
+
+def _parse_structured(text: str) -> Any:
+    # Sniff the first character so plain text skips the JSON attempt (and its
+    # exception) and, when it is obviously unstructured, the YAML parser too.
+    stripped = text.strip(" \t\r\n")
+    if stripped[:1] in _JSON_START or stripped in _JSON_WORDS:
+        if orjson is not None and not _LONG_DIGITS.search(stripped):
+            try:
+                return orjson.loads(stripped)
+            except orjson.JSONDecodeError:
+                pass  # json also accepts NaN/Infinity
         try:
-            return yaml.safe_load(text)
-        except yaml.YAMLError:
-            return text
+            return json.loads(stripped)
+        except json.JSONDecodeError:
+            pass
+    elif "\t" not in text and _PLAIN_TEXT.fullmatch(stripped) and stripped.lower() not in _YAML_WORDS:
+        return stripped
+    # JSON parses faster than a cached result can be copied; only YAML is worth caching.
+    if len(text) > _YAML_CACHE_MAX_CHARS:
+        return _parse_yaml.__wrapped__(text)
+    # Cached results are shared between calls, so hand out a private copy; deepcopy
+    # returns strings, numbers and other atoms unchanged.
+    return copy.deepcopy(_parse_yaml(text))
+
+
+@lru_cache(maxsize=256)
+def _parse_yaml(text: str) -> Any:
+    # Imported here so tools that only ever see JSON or plain text skip PyYAML;
+    # the libyaml-backed loader keeps yaml.safe_load semantics when available.
+    import yaml
+
+    try:
+        return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except yaml.YAMLError:
+        return text
+
+
+@lru_cache(maxsize=128)
+def _which(binary: str, search_path: str | None) -> str | None:
+    # Keyed on PATH too, so activating a toolchain mid-process is still picked up.
+    return shutil.which(binary, path=search_path)
 
 
 def _command_available(binary: str) -> bool:
-    return shutil.which(binary) is not None
+    return _which(binary, os.environ.get("PATH")) is not None
 
 
 def _run_command(args: Sequence[str], *, timeout: int = 120, cwd: Path | None = None) -> Dict[str, Any]:
@@ -49,6 +109,96 @@ def _run_command(args: Sequence[str], *, timeout: int = 120, cwd: Path | None =
         return {"code": 1, "stdout": "", "stderr": f"failed to run {' '.join(args)}: {exc}"}
 
 
+# Independent probes of one image run side by side; waiting on a child releases the GIL.
+_PROBE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agx-probe")
+
+
+def _start_command(args: Sequence[str], *, timeout: int = 120) -> Future[Dict[str, Any]]:
+    """Start ``_run_command`` in the background; ``.result()`` returns its usual dict."""
+
+    return _PROBE_POOL.submit(_run_command, args, timeout=timeout)
+
+
+class _CommandStream:
+    """Iterate a command's stdout line by line and stop the command once the caller is done.
+
+    For scans that only keep the first few matching lines of what can be hundreds of
+    megabytes of ``strings`` output. ``result()`` mirrors ``_run_command`` over the lines
+    actually read, except that ``stdout`` keeps only a head of about ``head_chars``
+    (what ``_summarize`` shows) instead of every line; a command stopped early on
+    purpose reports exit code 0.
+    """
+
+    def __init__(self, args: Sequence[str], *, timeout: int = 120, head_chars: int = 1200) -> None:
+        self._timeout = timeout
+        self._lines: List[str] = []
+        # Lines are kept until the head passes head_chars, so _summarize still sees
+        # that the output ran on and marks it truncated.
+        self._head_chars = head_chars
+        self._kept_chars = 0
+        self._exhausted = False
+        self._timed_out = threading.Event()
+        self._result: Dict[str, Any] | None = None
+        self._proc: subprocess.Popen[str] | None = None
+        # stderr goes to a file so a chatty command cannot block on a pipe nobody reads.
+        self._errors = tempfile.TemporaryFile()
+        try:
+            self._proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=self._errors, text=True, errors="replace")
+        except FileNotFoundError:
+            self._result = {"code": 127, "stdout": "", "stderr": f"{args[0]} not found"}
+        except Exception as exc:  # pragma: no cover - defensive guard
+            self._result = {"code": 1, "stdout": "", "stderr": f"failed to run {' '.join(args)}: {exc}"}
+        if self._proc is None:
+            self._errors.close()
+            return
+        self._timer = threading.Timer(timeout, self._expire)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _expire(self) -> None:
+        self._timed_out.set()
+        if self._proc is not None:
+            self._proc.kill()
+
+    def __iter__(self) -> Iterator[str]:
+        if self._proc is None or self._proc.stdout is None:
+            return
+        for line in self._proc.stdout:
+            line = line.rstrip("\n")
+            if self._kept_chars <= self._head_chars:
+                self._lines.append(line)
+                self._kept_chars += len(line) + 1
+            yield line
+        self._exhausted = True
+
+    def __enter__(self) -> "_CommandStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.result()
+
+    def result(self) -> Dict[str, Any]:
+        if self._result is not None:
+            return self._result
+        proc = self._proc
+        assert proc is not None
+        stopped = not self._exhausted and proc.poll() is None
+        if stopped:
+            proc.kill()
+        code = proc.wait()
+        self._timer.cancel()
+        if proc.stdout is not None:
+            proc.stdout.close()
+        self._errors.seek(0)
+        stderr = self._errors.read().decode(errors="replace").strip()
+        self._errors.close()
+        if self._timed_out.is_set():
+            self._result = {"code": -1, "stdout": "", "stderr": f"timeout after {self._timeout}s"}
+        else:
+            self._result = {"code": 0 if stopped else code, "stdout": "\n".join(self._lines).strip(), "stderr": stderr}
+        return self._result
+
+
 def _summarize(label: str, result: Dict[str, Any], *, limit: int = 1200) -> str:
     output = (result.get("stdout") or result.get("stderr") or "").strip()
     if not output:
@@ -59,6 +209,85 @@ def _summarize(label: str, result: Dict[str, Any], *, limit: int = 1200) -> str:
     return f"{label} ({status}):\n{output}"
 
 
+_HUNK_HEADER = re.compile(r"@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+# Below this many lines in the trimmed middle difflib finishes before git would even start.
+_GIT_DIFF_MIN_LINES = 2000
+
+
+def _git_histogram_diff(baseline: List[str], current: List[str], *, context: int) -> List[str] | None:
+    """Unified diff from ``git diff --no-index --histogram``, or None when git is unavailable.
+
+    Returns the same ``---``/``+++`` header as difflib; hunk headers keep git's trailing
+    function-context text, which ``_unified_diff`` drops when it renumbers them.
+    """
+
+    if not _command_available("git"):
+        return None
+    with tempfile.TemporaryDirectory(prefix="agx-diff-") as workdir:
+        paths = []
+        for name, lines in (("baseline", baseline), ("current", current)):
+            path = Path(workdir) / name
+            path.write_text("\n".join(lines) + "\n" if lines else "", encoding="utf-8", errors="surrogateescape")
+            paths.append(str(path))
+        args = ["git", "diff", "--no-index", "--no-color", "--no-ext-diff", "--histogram", f"--unified={context}", *paths]
+        # Ignore user/system config such as diff.suppressBlankEmpty that would change the output.
+        env = {**os.environ, "GIT_CONFIG_GLOBAL": os.devnull, "GIT_CONFIG_NOSYSTEM": "1"}
+        try:
+            proc = subprocess.run(
+                args, capture_output=True, text=True, encoding="utf-8", errors="surrogateescape", env=env, timeout=120
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+    # Exit status 1 means "differences found"; anything else is a failure.
+    if proc.returncode not in (0, 1):
+        return None
+    output = proc.stdout.splitlines()
+    start = next((index for index, line in enumerate(output) if line.startswith("@@")), None)
+    if start is None:
+        # Identical inputs, or git treated them as binary and printed no hunks.
+        return [] if proc.returncode == 0 else None
+    return ["--- baseline", "+++ current", *output[start:]]
+
+
+def _unified_diff(baseline: List[str], current: List[str], *, context: int = 3) -> Iterator[str]:
+    """Unified diff of two line lists that skips their common prefix and suffix.
+
+    Manifests usually differ in a few lines, so only the differing middle (plus
+    ``context`` lines either side) is diffed; hunk headers are shifted back to line
+    numbers in the full inputs. Large middles go to git's histogram diff, which stays
+    near-linear where difflib's matcher turns quadratic.
+    """
+
+    limit = min(len(baseline), len(current))
+    prefix = 0
+    while prefix < limit and baseline[prefix] == current[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and baseline[-1 - suffix] == current[-1 - suffix]:
+        suffix += 1
+    head = max(0, prefix - context)
+    tail = max(0, suffix - context)
+    old = baseline[head : len(baseline) - tail]
+    new = current[head : len(current) - tail]
+    lines: Iterable[str] | None = None
+    if max(len(old), len(new)) >= _GIT_DIFF_MIN_LINES:
+        lines = _git_histogram_diff(old, new, context=context)
+    if lines is None:
+        # Only FirmwareDiffTool needs difflib, so skip its import cost for everyone else.
+        import difflib
+
+        lines = difflib.unified_diff(old, new, fromfile="baseline", tofile="current", lineterm="", n=context)
+    for line in lines:
+        if line.startswith("@@"):
+            match = _HUNK_HEADER.match(line)
+            if match:
+                old_start, old_len, new_start, new_len = match.groups()
+                line = f"@@ -{int(old_start) + head}{old_len or ''} +{int(new_start) + head}{new_len or ''} @@"
+        yield line
+
+
 def _resolve_path(payload: Any) -> Path | None:
     if not isinstance(payload, dict):
         return None
@@ -79,6 +308,8 @@ def _validate_path(path: Path) -> str | None:
 class NmapScanTool(Tool):
     """Runs an nmap scan and summarizes the output."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         if not _command_available("nmap"):
             return ToolResult(
@@ -115,15 +346,15 @@ class NmapScanTool(Tool):
 class FirmwareDiffTool(Tool):
     """Produces a textual diff between two firmware manifests."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text)
         if not isinstance(payload, dict):
             raise ValueError("FirmwareDiffTool expects a JSON/YAML payload with 'baseline' and 'current'")
         baseline = (payload.get("baseline") or "").splitlines()
         current = (payload.get("current") or "").splitlines()
-        diff = "\n".join(
-            difflib.unified_diff(baseline, current, fromfile="baseline", tofile="current", lineterm="")
-        )
+        diff = "\n".join(_unified_diff(baseline, current))
         if not diff:
             diff = "No differences detected"
         return ToolResult(
@@ -135,22 +366,28 @@ class FirmwareDiffTool(Tool):
 class OrderLookupTool(Tool):
     """Looks up metadata for a sales order from an in-memory store."""
 
+    __slots__ = ("_orders", "_rendered")
+
     def __init__(self, name: str, **kwargs: Any) -> None:
         super().__init__(name, **kwargs)
         raw_orders: Iterable[Dict[str, Any]] = kwargs.get("orders") or []
         self._orders = {str(entry["id"]): entry for entry in raw_orders if "id" in entry}
+        # Orders are fixed for the tool's lifetime, so render each one up front.
+        self._rendered = {order_id: json.dumps(entry, indent=2) for order_id, entry in self._orders.items()}
 
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         order_id = str(input_text or context.metadata.get("order_id", ""))
-        match = self._orders.get(order_id)
-        if not match:
+        rendered = self._rendered.get(order_id)
+        if rendered is None:
             return ToolResult(content=f"Order {order_id} not found", metadata={"found": "false"})
-        return ToolResult(content=json.dumps(match, indent=2), metadata={"found": "true"})
+        return ToolResult(content=rendered, metadata={"found": "true"})
 
 
 class AnomalyScoringTool(Tool):
     """Assigns a lightweight anomaly score based on provided signals."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text)
         signals = payload.get("signals") if isinstance(payload, dict) else []
@@ -160,20 +397,25 @@ class AnomalyScoringTool(Tool):
         return ToolResult(content=content, metadata={"score": str(score)})
 
 
+# Only the first step of the edge deployment plan depends on the model.
+_EDGE_PLAN_TAIL = "- " + "\n- ".join(
+    (
+        "Run hardware-in-loop smoke tests",
+        "Package container image with telemetry hooks",
+        "Schedule phased rollout with canary monitoring",
+    )
+)
+
+
 class EdgeDeploymentPlannerTool(Tool):
     """Creates a deployment checklist for on-board/edge inference."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text)
         model = payload.get("model", "edge-model") if isinstance(payload, dict) else "edge-model"
-        steps: List[str] = [
-            f"Validate quantization for {model}",
-            "Run hardware-in-loop smoke tests",
-            "Package container image with telemetry hooks",
-            "Schedule phased rollout with canary monitoring",
-        ]
-        plan = "\n".join(f"- {step}" for step in steps)
-        return ToolResult(content=f"Deployment plan for {model}:\n{plan}")
+        return ToolResult(content=f"Deployment plan for {model}:\n- Validate quantization for {model}\n{_EDGE_PLAN_TAIL}")
 
 
 MAGIC_BYTE_CATALOG: Sequence[Dict[str, Any]] = [
@@ -312,14 +554,153 @@ MAGIC_BYTE_CATALOG: Sequence[Dict[str, Any]] = [
 ]
 
 
-def _normalize_hex(value: str) -> str:
-    cleaned = value.upper().replace("0X", "").replace(" ", "")
-    return cleaned
+_MAGIC_WILDCARDS = frozenset("xX?")
+# Wildcard nibbles become 0 in the value and every literal nibble becomes F in the mask.
+_MAGIC_VALUE_TABLE = str.maketrans(dict.fromkeys(_MAGIC_WILDCARDS, "0"))
+_MAGIC_MASK_TABLE = str.maketrans({**dict.fromkeys("0123456789abcdefABCDEF", "F"), **dict.fromkeys(_MAGIC_WILDCARDS, "0")})
+
+
+def _compile_magic(pattern: str) -> Tuple[bytes, bytes]:
+    """Return ``(value, mask)`` for a catalog hex pattern; ``x``/``?`` nibbles match anything."""
+
+    digits = pattern.strip().replace(" ", "")
+    if digits[:2].lower() == "0x":
+        digits = digits[2:]
+    if len(digits) % 2:
+        digits += "?"
+    value = bytes.fromhex(digits.translate(_MAGIC_VALUE_TABLE))
+    mask = bytes.fromhex(digits.translate(_MAGIC_MASK_TABLE))
+    return value, mask
+
+
+def _is_specific_magic(value: bytes, mask: bytes) -> bool:
+    # Wildcard, short (< 4 byte) and single-byte-run signatures such as the all-zero
+    # FIT magic also turn up in padding and unrelated headers.
+    return len(value) >= 4 and all(byte == 0xFF for byte in mask) and len(set(value)) > 1
+
+
+def _magic_offset(offset: str) -> int:
+    # Catalog entries without a fixed offset ("blocks", "-") are checked at the start of the file.
+    try:
+        return int(offset, 16)
+    except ValueError:
+        return 0
+
+
+def _build_magic_index() -> Tuple[Dict[Tuple[int, int], List[Tuple[Any, ...]]], List[Tuple[Any, ...]]]:
+    """Compile ``MAGIC_BYTE_CATALOG`` once into lookup tables for ``_match_magic``.
+
+    Signatures are ``(position, offset, value, mask, name, label, specific)`` tuples. Literal
+    patterns keep ``value`` as bytes with a None ``mask``; wildcard patterns store both
+    as big-endian ints so matching is a single AND and compare. Those whose first byte is literal are keyed by
+    ``(offset, first byte)``, so a header only meets the few that can match it.
+    """
+
+    index: Dict[Tuple[int, int], List[Tuple[Any, ...]]] = {}
+    wildcard: List[Tuple[Any, ...]] = []
+    for position, item in enumerate(MAGIC_BYTE_CATALOG):
+        offset = _magic_offset(str(item["offset"]))
+        label = f"{item['name']} (offset {item['offset']}): {item['notes']}"
+        for pattern in item["magic"]:
+            value, mask = _compile_magic(pattern)
+            specific = _is_specific_magic(value, mask)
+            if all(byte == 0xFF for byte in mask):
+                signature = (position, offset, value, None, item["name"], label, specific)
+            else:
+                signature = (
+                    position,
+                    offset,
+                    int.from_bytes(value, "big"),
+                    (len(value), int.from_bytes(mask, "big")),
+                    item["name"],
+                    label,
+                    specific,
+                )
+            if mask[0] == 0xFF:
+                index.setdefault((offset, value[0]), []).append(signature)
+            else:
+                wildcard.append(signature)
+    return index, wildcard
+
+
+_MAGIC_INDEX, _MAGIC_WILDCARD = _build_magic_index()
+_MAGIC_OFFSETS = tuple(sorted({offset for offset, _ in _MAGIC_INDEX}))
+# Enough leading bytes to cover every fixed-offset signature in the catalog.
+_MAGIC_HEADER_BYTES = 1024
+
+
+def _match_magic(header: bytes) -> List[Tuple[str, str, bool]]:
+    """Return ``(name, label, specific)`` for each catalog entry whose magic matches ``header``.
+
+    ``specific`` is True when a distinctive literal signature matched (see
+    ``_is_specific_magic``), rather than only a wildcard or short one.
+    """
+
+    candidates: List[Tuple[Any, ...]] = []
+    for offset in _MAGIC_OFFSETS:
+        if offset < len(header):
+            candidates.extend(_MAGIC_INDEX.get((offset, header[offset]), ()))
+    candidates.extend(_MAGIC_WILDCARD)
+    matched: Dict[int, Tuple[str, str, bool]] = {}
+    for position, offset, value, mask, name, label, specific in candidates:
+        if position in matched and (matched[position][2] or not specific):
+            continue
+        if mask is None:
+            hit = header.startswith(value, offset)
+        else:
+            width, bits = mask
+            chunk = header[offset : offset + width]
+            hit = len(chunk) == width and int.from_bytes(chunk, "big") & bits == value
+        if hit:
+            matched[position] = (name, label, specific)
+    return [matched[position] for position in sorted(matched)]
+
+
+def _build_magic_scanner() -> Tuple[re.Pattern[bytes], Dict[bytes, Tuple[int, str]]]:
+    """Compile the catalog's distinctive literal signatures into one bytes alternation.
+
+    Used to find embedded images anywhere in a file. Signatures that are not
+    ``_is_specific_magic`` would match padding everywhere, so they are left to the
+    header check in ``_match_magic``.
+    """
+
+    signatures: Dict[bytes, Tuple[int, str]] = {}
+    for item in MAGIC_BYTE_CATALOG:
+        offset = _magic_offset(str(item["offset"]))
+        for pattern in item["magic"]:
+            value, mask = _compile_magic(pattern)
+            if _is_specific_magic(value, mask):
+                signatures.setdefault(value, (offset, item["name"]))
+    ordered = sorted(signatures, key=len, reverse=True)
+    return re.compile(b"|".join(map(re.escape, ordered))), signatures
+
+
+_MAGIC_SCANNER, _MAGIC_SCAN_SIGNATURES = _build_magic_scanner()
+
+
+def _scan_magic(data: Any, *, limit: int = 200) -> List[Tuple[int, str]]:
+    """Return ``(image offset, name)`` for embedded catalog signatures in ``data``.
+
+    ``data`` may be bytes or an mmap; the scan is a single pass of the compiled
+    alternation, and offsets are corrected for signatures that sit past the image start.
+    """
+
+    hits: List[Tuple[int, str]] = []
+    for match in _MAGIC_SCANNER.finditer(data):
+        offset, name = _MAGIC_SCAN_SIGNATURES[match.group()]
+        start = match.start() - offset
+        if start >= 0:
+            hits.append((start, name))
+            if len(hits) >= limit:
+                break
+    return hits
 
 
 class FirmwareIntakeTool(Tool):
     """Guides decompression + OS branching at the start of the workflow."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -334,9 +715,7 @@ class FirmwareIntakeTool(Tool):
         if validation_error:
             return ToolResult(content=validation_error, metadata={"error": "missing_file"})
 
-        results: List[str] = []
-        file_result = _run_command(["file", "-b", str(firmware_path)])
-        results.append(_summarize("file", file_result))
+        file_summary = _summarize("file", _run_command(["file", "-b", str(firmware_path)]))
 
         extract = bool(payload.get("extract") or self.config.get("extract"))
         output_dir = Path(payload.get("output_dir") or firmware_path.parent / f"{firmware_path.stem}_extract")
@@ -345,21 +724,38 @@ class FirmwareIntakeTool(Tool):
                 output_dir.mkdir(parents=True, exist_ok=True)
                 timeout = int(payload.get("timeout", 300))
                 args = ["binwalk", "--extract", "--directory", str(output_dir), str(firmware_path)]
-                results.append(_summarize("binwalk --extract", _run_command(args, timeout=timeout)))
+                extraction = _summarize("binwalk --extract", _run_command(args, timeout=timeout))
             else:
-                results.append("binwalk not available on PATH; skipping extraction.")
+                extraction = "binwalk not available on PATH; skipping extraction."
         else:
-            results.append("Extraction disabled (set extract: true to carve sections with binwalk).")
+            extraction = "Extraction disabled (set extract: true to carve sections with binwalk)."
 
         metadata = {"path": str(firmware_path)}
         if extract:
             metadata["output_dir"] = str(output_dir)
-        return ToolResult(content="\n\n".join(results), metadata=metadata)
+        return ToolResult(content=f"{file_summary}\n\n{extraction}", metadata=metadata)
 
 
+# Printable ASCII maps to itself and everything else to "." for the hex dump gutter.
+_HEX_DUMP_TEXT = bytes(byte if 0x20 <= byte < 0x7F else 0x2E for byte in range(256))
+
+
+def _hex_dump(data: bytes) -> str:
+    """Render ``data`` the way ``xxd`` does: 16 bytes per line in 2-byte groups."""
+
+    lines = []
+    for offset in range(0, len(data), 16):
+        row = data[offset : offset + 16]
+        groups = row.hex(" ", -2)
+        lines.append(f"{offset:08x}: {groups:<39}  {row.translate(_HEX_DUMP_TEXT).decode('ascii')}")
+    return "\n".join(lines)
+
+
 class FirmwareFormatIdentifierTool(Tool):
     """Matches headers/magic bytes using real file/binwalk output."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -375,28 +771,53 @@ class FirmwareFormatIdentifierTool(Tool):
             return ToolResult(content=validation_error, metadata={"error": "missing_file"})
 
         sections: List[str] = []
-        sections.append(_summarize("file", _run_command(["file", str(firmware_path)])))
+        binwalk_probe = None
+        if _command_available("binwalk"):
+            binwalk_probe = _start_command(["binwalk", "--signature", "--nobanner", str(firmware_path)])
 
-        if _command_available("xxd"):
-            sections.append(_summarize("xxd -l 64", _run_command(["xxd", "-l", "64", str(firmware_path)])))
-        elif _command_available("hexdump"):
-            sections.append(_summarize("hexdump -C -n 64", _run_command(["hexdump", "-C", "-n", "64", str(firmware_path)])))
+        metadata = {"path": str(firmware_path)}
+        header: bytes | None = None
+        matches: List[Tuple[str, str, bool]] = []
+        try:
+            with firmware_path.open("rb", buffering=0) as handle:
+                header = handle.read(_MAGIC_HEADER_BYTES)
+        except OSError as exc:
+            sections.append(f"Magic-byte catalog skipped: {exc}")
         else:
-            sections.append("xxd/hexdump unavailable; skipping inline header bytes.")
+            matches = _match_magic(header)
+            if matches:
+                labels = [label for _, label, _ in matches]
+                sections.append("Magic-byte catalog matches:\n- " + "\n- ".join(labels))
+                metadata["magic"] = ",".join(name for name, _, _ in matches)
+            else:
+                sections.append("Magic-byte catalog matches: none")
 
-        if _command_available("binwalk"):
-            sections.append(
-                _summarize("binwalk --signature", _run_command(["binwalk", "--signature", "--nobanner", str(firmware_path)]))
-            )
+        # A specific catalog match already names the header; wildcard or short
+        # signatures (all-zero FIT, Intel HEX ':') are too weak to skip `file`.
+        if not any(specific for _, _, specific in matches):
+            sections.insert(0, _summarize("file", _run_command(["file", str(firmware_path)])))
+
+        if header is not None:
+            sections.append(f"Header bytes (first 64):\n{_hex_dump(header[:64]) or '<empty file>'}")
+
+        if binwalk_probe is not None:
+            sections.append(_summarize("binwalk --signature", binwalk_probe.result()))
         else:
             sections.append("binwalk not available on PATH; install it to see signature matches.")
 
-        return ToolResult(content="\n\n".join(sections), metadata={"path": str(firmware_path)})
+        return ToolResult(content="\n\n".join(sections), metadata=metadata)
 
 
+# `file` output hints in priority order; one regex pass finds every hint present.
+_FILE_ARCH_HINTS = {"arm": "ARM (from file hint)", "mips": "MIPS (from file hint)", "x86-64": "x86-64 (from file hint)"}
+_FILE_ARCH_HINT = re.compile(r"arm|mips|x86[-_]64")
+
+
 class ArchitectureInferenceTool(Tool):
     """Derives CPU/endianness using binutils (`readelf`/`objdump`)."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -411,6 +832,8 @@ class ArchitectureInferenceTool(Tool):
         if validation_error:
             return ToolResult(content=validation_error, metadata={"error": "missing_file"})
 
+        # `file` does not depend on the binutils results, so let it run alongside them.
+        file_probe = _start_command(["file", str(firmware_path)]) if _command_available("file") else None
         reports: List[str] = []
         machine: str | None = None
         endian: str | None = None
@@ -469,20 +892,17 @@ class ArchitectureInferenceTool(Tool):
                     endian = endian or "Big endian (heuristic)"
                     source = "vector_table_heuristic"
 
-        if _command_available("file"):
-            file_result = _run_command(["file", str(firmware_path)])
+        if file_probe is not None:
+            file_result = file_probe.result()
             reports.append(_summarize("file", file_result))
             file_text = (file_result.get("stdout", "") + " " + file_result.get("stderr", "")).lower()
             if not machine:
-                if "arm" in file_text:
-                    machine = "ARM (from file hint)"
-                    source = "file_hint"
-                elif "mips" in file_text:
-                    machine = "MIPS (from file hint)"
-                    source = "file_hint"
-                elif "x86-64" in file_text or "x86_64" in file_text:
-                    machine = "x86-64 (from file hint)"
-                    source = "file_hint"
+                found = {hint.replace("_", "-") for hint in _FILE_ARCH_HINT.findall(file_text)}
+                for hint, label in _FILE_ARCH_HINTS.items():
+                    if hint in found:
+                        machine = label
+                        source = "file_hint"
+                        break
 
         metadata = {"path": str(firmware_path)}
         if machine:
@@ -498,9 +918,32 @@ class ArchitectureInferenceTool(Tool):
         return ToolResult(content="\n\n".join(reports), metadata=metadata)
 
 
+def _scan_sections_in_process(firmware_path: Path) -> ToolResult:
+    """Fallback for FirmwareSectionExtractorTool: map the image and scan it for catalog signatures."""
+
+    try:
+        with firmware_path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            hits = _scan_magic(view)
+    except ValueError:  # mmap refuses empty files
+        hits = []
+    except OSError as exc:
+        return ToolResult(content=f"Failed to read {firmware_path}: {exc}", metadata={"error": "read_failed"})
+    lines = [f"0x{offset:08X}  {name}" for offset, name in hits] or ["No catalog signatures found."]
+    content = (
+        "binwalk not available on PATH; scanned for magic-byte catalog signatures instead "
+        "(install binwalk for full signatures and carving).\n" + "\n".join(lines)
+    )
+    return ToolResult(
+        content=content,
+        metadata={"path": str(firmware_path), "scanner": "magic_catalog", "signatures": str(len(hits))},
+    )
+
+
 class FirmwareSectionExtractorTool(Tool):
     """Uses binwalk to enumerate (and optionally carve) sections."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -515,7 +958,7 @@ class FirmwareSectionExtractorTool(Tool):
         if validation_error:
             return ToolResult(content=validation_error, metadata={"error": "missing_file"})
         if not _command_available("binwalk"):
-            return ToolResult(content="binwalk not available on PATH; install it to scan the firmware.", metadata={"error": "missing_binwalk"})
+            return _scan_sections_in_process(firmware_path)
 
         reports: List[str] = []
         reports.append(_summarize("binwalk --nobanner", _run_command(["binwalk", "--nobanner", str(firmware_path)])))
@@ -542,6 +985,8 @@ class FirmwareSectionExtractorTool(Tool):
 class FirmwareStaticAnalyzerTool(Tool):
     """Runs strings/grep against the firmware to surface interesting components."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -581,15 +1026,12 @@ class FirmwareStaticAnalyzerTool(Tool):
                 )
             )
         elif _command_available("strings"):
-            strings_result = _run_command(["strings", "-n", "6", str(firmware_path)], timeout=timeout)
-            lines = strings_result.get("stdout", "").splitlines()
-            matches: List[str] = []
-            for line in lines:
-                lowered = line.lower()
-                if any(p.lower() in lowered for p in patterns):
-                    matches.append(line)
-                if len(matches) >= 40:
-                    break
+            # Same case-insensitive substring test as before, as one search per line; strings
+            # is stopped as soon as the first 40 hits are in.
+            keywords = re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE)
+            with _CommandStream(["strings", "-n", "6", str(firmware_path)], timeout=timeout) as stream:
+                matches = list(islice(filter(keywords.search, stream), 40))
+            strings_result = stream.result()
             reports.append(_summarize("strings", strings_result))
             reports.append("Keyword hits:\n" + ("\n".join(matches) if matches else "No keyword hits found."))
         else:
@@ -601,15 +1043,51 @@ class FirmwareStaticAnalyzerTool(Tool):
         return ToolResult(content="\n\n".join(reports), metadata={"path": str(firmware_path)})
 
 
+_SECRET_PATTERN = re.compile(
+    r"(?i)(password|passwd|api[_-]?key|secret|token|authorization|bearer|private key|ssh-rsa)"
+)
+_SECRET_BYTES_PATTERN = re.compile(_SECRET_PATTERN.pattern.encode())
+
+
+def _tally_matches(pattern: re.Pattern[Any], data: Any) -> Tuple[int, Set[Any]]:
+    """Count ``pattern``'s matches in ``data`` and collect the distinct ones in one pass.
+
+    Reports what ``findall`` would (the first group when the pattern has one) without
+    materialising every match, which can run into millions on a large image.
+    """
+
+    group = 1 if pattern.groups else 0
+    count = 0
+    distinct: Set[Any] = set()
+    for match in pattern.finditer(data):
+        count += 1
+        distinct.add(match[group] or match[0][:0])
+    return count, distinct
+
+
+def _tally_mapped(path: Path, pattern: re.Pattern[bytes]) -> Tuple[int, Set[bytes]]:
+    """``_tally_matches`` over a memory-mapped file, so the image is never copied or decoded."""
+
+    with path.open("rb") as handle:
+        try:
+            view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # mmap refuses empty files
+            return 0, set()
+        with view:
+            return _tally_matches(pattern, view)
+
+
 class SecretScannerTool(Tool):
     """Extracts potential secrets or credentials."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
             payload = {}
         firmware_path = _resolve_path(payload)
-        pattern = payload.get("pattern") or r"(?i)(password|passwd|api[_-]?key|secret|token|authorization|bearer|private key|ssh-rsa)"
+        pattern = payload.get("pattern") or _SECRET_PATTERN.pattern
         timeout = int(payload.get("timeout", 180))
 
         if firmware_path:
@@ -621,24 +1099,68 @@ class SecretScannerTool(Tool):
                 summary = _summarize("ripgrep secret scan", result)
                 hits = len(result.get("stdout", "").splitlines())
                 return ToolResult(content=summary, metadata={"path": str(firmware_path), "hits": str(hits)})
+            compiled = _SECRET_BYTES_PATTERN if pattern == _SECRET_PATTERN.pattern else re.compile(pattern.encode())
             try:
-                text = firmware_path.read_bytes().decode(errors="ignore")
+                count, matches = _tally_mapped(firmware_path, compiled)
             except Exception as exc:  # pragma: no cover - guard
                 return ToolResult(content=f"Failed to read {firmware_path}: {exc}", metadata={"error": "read_failed"})
         else:
             text = str(payload.get("blob", ""))
             if not text and isinstance(input_text, str):
                 text = input_text
+            count, matches = _tally_matches(_SECRET_PATTERN if pattern == _SECRET_PATTERN.pattern else re.compile(pattern), text)
 
-        matches = re.findall(pattern, text)
-        unique_hits = sorted(set(match.lower() for match in matches))
+        # Each distinct raw spelling is lowercased once; matches from a mapped file are
+        # bytes and are decoded only at that point.
+        distinct = {match.lower() for match in matches}
+        unique_hits = sorted(hit.decode(errors="ignore") if isinstance(hit, bytes) else hit for hit in distinct)
         content = "No secrets detected." if not unique_hits else f"Indicators: {', '.join(unique_hits)}"
-        return ToolResult(content=content, metadata={"hits": str(len(matches))})
+        return ToolResult(content=content, metadata={"hits": str(count)})
 
 
+_INSECURE_PROTOCOLS = frozenset({"telnet", "ftp", "http"})
+_WEAKNESS_KEYWORDS = {
+    "telnet": r"telnetd",
+    "ftp": r"ftpd|vsftpd",
+    "http": r"httpd|lighttpd|nginx|apache",
+    "ssh": r"sshd|dropbear",
+    "ota": r"ota|upgrade|fw_update",
+    "md5": r"md5",
+    "unsigned": r"unsigned|no\s*signature",
+}
+# One alternation finds candidate lines in a single pass (and a single rg call); the
+# per-label patterns then attribute each candidate, since a line can hit several labels.
+# The rg output is streamed and stops once every label has its five excerpts. The
+# -m cap only bounds images where some label never fills; it is set well above the
+# 7 x 5 excerpts kept so one frequent keyword does not crowd the rarer ones out.
+_WEAKNESS_ANY = "|".join(f"(?:{regex})" for regex in _WEAKNESS_KEYWORDS.values())
+_WEAKNESS_ANY_RE = re.compile(_WEAKNESS_ANY, re.IGNORECASE)
+_WEAKNESS_LABEL_RES = [(label, re.compile(regex, re.IGNORECASE)) for label, regex in _WEAKNESS_KEYWORDS.items()]
+_WEAKNESS_RG_MAX_LINES = 1000
+
+
+def _attribute_weakness_lines(lines: Iterable[str]) -> Dict[str, List[str]]:
+    """Group ``lines`` under every keyword label they match, keeping five per label."""
+
+    detected: Dict[str, List[str]] = {}
+    full = 0
+    for line in lines:
+        for label, compiled in _WEAKNESS_LABEL_RES:
+            if compiled.search(line):
+                hits = detected.setdefault(label, [])
+                if len(hits) < 5:
+                    hits.append(line)
+                    full += len(hits) == 5
+        if full == len(_WEAKNESS_LABEL_RES):
+            break
+    return {label: detected[label] for label, _ in _WEAKNESS_LABEL_RES if label in detected}
+
+
 class WeaknessProfilerTool(Tool):
     """Scores weaknesses across protocols, RTOS, crypto, updater using real scans."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -646,15 +1168,6 @@ class WeaknessProfilerTool(Tool):
         firmware_path = _resolve_path(payload)
         timeout = int(payload.get("timeout", 180))
 
-        keyword_map = {
-            "telnet": r"telnetd",
-            "ftp": r"ftpd|vsftpd",
-            "http": r"httpd|lighttpd|nginx|apache",
-            "ssh": r"sshd|dropbear",
-            "ota": r"ota|upgrade|fw_update",
-            "md5": r"md5",
-            "unsigned": r"unsigned|no\s*signature",
-        }
         detected: Dict[str, List[str]] = {}
 
         if firmware_path:
@@ -662,21 +1175,14 @@ class WeaknessProfilerTool(Tool):
             if validation_error:
                 return ToolResult(content=validation_error, metadata={"error": "missing_file"})
             if _command_available("rg"):
-                for label, regex in keyword_map.items():
-                    result = _run_command(
-                        ["rg", "-n", "-i", "--no-config", "-m", "5", "-e", regex, str(firmware_path)], timeout=timeout
-                    )
-                    lines = [line for line in result.get("stdout", "").splitlines() if line.strip()]
-                    if lines:
-                        detected[label] = lines[:5]
+                with _CommandStream(
+                    ["rg", "-n", "-i", "--no-config", "-m", str(_WEAKNESS_RG_MAX_LINES), "-e", _WEAKNESS_ANY, str(firmware_path)],
+                    timeout=timeout,
+                ) as stream:
+                    detected = _attribute_weakness_lines(line for line in stream if line.strip())
             elif _command_available("strings"):
-                strings_result = _run_command(["strings", "-n", "6", str(firmware_path)], timeout=timeout)
-                lines = strings_result.get("stdout", "").splitlines()
-                for label, regex in keyword_map.items():
-                    compiled = re.compile(regex, re.IGNORECASE)
-                    matches = [line for line in lines if compiled.search(line)]
-                    if matches:
-                        detected[label] = matches[:5]
+                with _CommandStream(["strings", "-n", "6", str(firmware_path)], timeout=timeout) as stream:
+                    detected = _attribute_weakness_lines(filter(_WEAKNESS_ANY_RE.search, stream))
             else:
                 return ToolResult(
                     content="Install ripgrep or strings to profile weaknesses from the firmware image.",
@@ -689,7 +1195,7 @@ class WeaknessProfilerTool(Tool):
         updater = payload.get("updater", "unknown")
 
         score = 20
-        if any(p.lower() in {"telnet", "ftp", "http"} for p in protocols):
+        if not _INSECURE_PROTOCOLS.isdisjoint(map(str.lower, protocols)):
             score += 20
         if detected.get("md5") or (isinstance(crypto, str) and "md5" in crypto.lower()):
             score += 15
@@ -714,6 +1220,8 @@ class WeaknessProfilerTool(Tool):
 class FirmwareDirectoryListTool(Tool):
     """Lists files in the selected firmware working directory."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -738,6 +1246,8 @@ class FirmwareDirectoryListTool(Tool):
 class FirmwareEntropyCheckTool(Tool):
     """Runs entropy checks to determine whether firmware appears compressed/encrypted."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -805,6 +1315,8 @@ class FirmwareEntropyCheckTool(Tool):
 class FirmwareExtractTool(Tool):
     """Exact extraction step using binwalk -e <firmware>."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -837,9 +1349,22 @@ class FirmwareExtractTool(Tool):
         return ToolResult(content=content, metadata=md)
 
 
+# OS families in priority order; each family's tokens are searched in a single pass.
+_OS_TOKENS = tuple(
+    (label, re.compile("|".join(map(re.escape, tokens))))
+    for label, tokens in (
+        ("Linux", ("busybox", "/etc/init", "/proc/", "linux")),
+        ("RTOS", ("freertos", "zephyr", "threadx", "vxworks", "nucleus", "rtos")),
+        ("Bare metal", ("startup", "vector table", "bare metal")),
+    )
+)
+
+
 class FirmwareOsIdentifierTool(Tool):
     """Identifies likely OS family and checks ARM magic-byte heuristic."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -866,19 +1391,21 @@ class FirmwareOsIdentifierTool(Tool):
         reports.append(_summarize("file", file_result))
         file_text = (file_result.get("stdout", "") + " " + file_result.get("stderr", "")).lower()
 
-        strings_result = _run_command(["strings", "-n", "6", str(extracted_path)], timeout=int(payload.get("timeout", 180)))
-        sample_lines = strings_result.get("stdout", "").splitlines()[:3000]
+        with _CommandStream(["strings", "-n", "6", str(extracted_path)], timeout=int(payload.get("timeout", 180))) as stream:
+            sample_lines = list(islice(stream, 3000))
+        strings_result = stream.result()
         sample_blob = "\n".join(sample_lines).lower()
         reports.append(f"Command: strings -n 6 {extracted_path}")
         reports.append(_summarize("strings -n 6", strings_result))
 
         os_guess = "Other"
-        if "linux" in file_text or any(token in sample_blob for token in ["busybox", "/etc/init", "/proc/", "linux"]):
+        if "linux" in file_text:
             os_guess = "Linux"
-        elif any(token in sample_blob for token in ["freertos", "zephyr", "threadx", "vxworks", "nucleus", "rtos"]):
-            os_guess = "RTOS"
-        elif any(token in sample_blob for token in ["startup", "vector table", "bare metal"]):
-            os_guess = "Bare metal"
+        else:
+            for label, tokens in _OS_TOKENS:
+                if tokens.search(sample_blob):
+                    os_guess = label
+                    break
 
         hexdump_result = _run_command(["hexdump", "-C", "-n", "128", str(extracted_path)])
         reports.append(f"Command: hexdump {extracted_path} | head")
@@ -906,6 +1433,8 @@ class FirmwareOsIdentifierTool(Tool):
 class FirmwareHexToBinTool(Tool):
     """Converts Intel HEX firmware to BIN via objcopy."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -935,6 +1464,8 @@ class FirmwareHexToBinTool(Tool):
 class FirmwareKeyFinderTool(Tool):
     """Runs strings and extracts potential keys/passwords into a text artifact."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -975,6 +1506,8 @@ class FirmwareKeyFinderTool(Tool):
 class FirmwareGhidraHandoffTool(Tool):
     """Produces a concrete analyst handoff for loading firmware in Ghidra."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -1002,7 +1535,7 @@ class FirmwareGhidraHandoffTool(Tool):
 
         ghidra_bins: Dict[str, str] = {}
         for command in ("ghidra", "ghidraRun", "analyzeHeadless"):
-            resolved = shutil.which(command)
+            resolved = _which(command, os.environ.get("PATH"))
             if resolved:
                 ghidra_bins[command] = resolved
         # Avoid broad filesystem scans in this final step; use PATH plus an optional explicit ghidra_home.
@@ -1077,6 +1610,8 @@ class FirmwareGhidraHandoffTool(Tool):
 class FirmwarePreflightTool(Tool):
     """Preflight checks: dependencies, path validity, and isolated workspace creation."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -1118,6 +1653,8 @@ class FirmwarePreflightTool(Tool):
 class FirmwareFormatDetectorTool(Tool):
     """Detects firmware format and classifies by branch for workflow decisions."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -1149,6 +1686,8 @@ class FirmwareFormatDetectorTool(Tool):
 class FirmwarePrepareBinaryTool(Tool):
     """Produces a binary artifact from HEX if needed, otherwise reuses original binary."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -1205,6 +1744,8 @@ class FirmwarePrepareBinaryTool(Tool):
 class DiskUsageTriageTool(Tool):
     """Uses df/du to assess disk usage and recommend cleanup targets."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text) or {}
         if not isinstance(payload, dict):
@@ -1292,11 +1833,8 @@ class DiskUsageTriageTool(Tool):
             largest.sort(key=lambda item: item[0], reverse=True)
             if largest:
                 top_n = int(payload.get("top_n", 5))
-                report_lines = []
-                for size_kb, path in largest[:top_n]:
-                    size_mb = size_kb / 1024
-                    report_lines.append(f"- {path}: {size_mb:.1f} MiB")
-                output_sections.append("Top directories by size:\n" + "\n".join(report_lines))
+                report_lines = [f"{path}: {size_kb / 1024:.1f} MiB" for size_kb, path in largest[:top_n]]
+                output_sections.append("Top directories by size:\n- " + "\n- ".join(report_lines))
         else:
             output_sections.append("Disk usage within acceptable thresholds; no cleanup required.")
 
@@ -1355,11 +1893,8 @@ class DiskUsageTriageTool(Tool):
         large_files.sort(key=lambda item: item[0], reverse=True)
         if large_files:
             top_files = int(payload.get("top_files", 10))
-            lines = []
-            for size_bytes, path in large_files[:top_files]:
-                size_mb = size_bytes / (1024 * 1024)
-                lines.append(f"- {path}: {size_mb:.1f} MiB")
-            output_sections.append(f"Largest files (> {min_mb} MiB):\n" + "\n".join(lines))
+            lines = [f"{path}: {size_bytes / (1024 * 1024):.1f} MiB" for size_bytes, path in large_files[:top_files]]
+            output_sections.append(f"Largest files (> {min_mb} MiB):\n- " + "\n- ".join(lines))
         else:
             output_sections.append(f"No files larger than {min_mb} MiB found under {target}.")
 
@@ -1369,6 +1904,8 @@ class DiskUsageTriageTool(Tool):
 class VerificationPlannerTool(Tool):
     """Creates a test/verify checklist from earlier findings."""
 
+    __slots__ = ()
+
     def run(self, *, input_text: str, context: ToolContext) -> ToolResult:
         payload = _load_structured(input_text)
         findings = payload.get("findings") or []
@@ -1377,76 +1914,36 @@ class VerificationPlannerTool(Tool):
         return ToolResult(content="\n".join(steps))
 
 
-def register_builtin_tools(registry: ToolRegistry) -> None:
-    """Register built-in tool factories."""
-
-    registry.register_factory("nmap_scan", lambda: NmapScanTool(name="nmap_scan"), overwrite=True)
-    registry.register_factory("firmware_diff", lambda: FirmwareDiffTool(name="firmware_diff"), overwrite=True)
-    registry.register_factory("order_lookup", lambda: OrderLookupTool(name="order_lookup"), overwrite=True)
-    registry.register_factory(
-        "anomaly_scoring", lambda: AnomalyScoringTool(name="anomaly_scoring"), overwrite=True
-    )
-    registry.register_factory(
-        "edge_deployment_planner",
-        lambda: EdgeDeploymentPlannerTool(name="edge_deployment_planner"),
-        overwrite=True,
-    )
-    registry.register_factory("firmware_intake", lambda: FirmwareIntakeTool(name="firmware_intake"), overwrite=True)
-    registry.register_factory(
-        "firmware_format_identifier",
-        lambda: FirmwareFormatIdentifierTool(name="firmware_format_identifier"),
-        overwrite=True,
-    )
-    registry.register_factory(
-        "architecture_inference", lambda: ArchitectureInferenceTool(name="architecture_inference"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_section_extractor",
-        lambda: FirmwareSectionExtractorTool(name="firmware_section_extractor"),
-        overwrite=True,
-    )
-    registry.register_factory(
-        "firmware_static_analyzer",
-        lambda: FirmwareStaticAnalyzerTool(name="firmware_static_analyzer"),
-        overwrite=True,
-    )
-    registry.register_factory("secret_scanner", lambda: SecretScannerTool(name="secret_scanner"), overwrite=True)
-    registry.register_factory(
-        "weakness_profiler", lambda: WeaknessProfilerTool(name="weakness_profiler"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_directory_list", lambda: FirmwareDirectoryListTool(name="firmware_directory_list"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_entropy_check", lambda: FirmwareEntropyCheckTool(name="firmware_entropy_check"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_preflight", lambda: FirmwarePreflightTool(name="firmware_preflight"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_format_detector", lambda: FirmwareFormatDetectorTool(name="firmware_format_detector"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_prepare_binary", lambda: FirmwarePrepareBinaryTool(name="firmware_prepare_binary"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_extract", lambda: FirmwareExtractTool(name="firmware_extract"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_os_identifier", lambda: FirmwareOsIdentifierTool(name="firmware_os_identifier"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_hex_to_bin", lambda: FirmwareHexToBinTool(name="firmware_hex_to_bin"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_key_finder", lambda: FirmwareKeyFinderTool(name="firmware_key_finder"), overwrite=True
-    )
-    registry.register_factory(
-        "firmware_ghidra_handoff", lambda: FirmwareGhidraHandoffTool(name="firmware_ghidra_handoff"), overwrite=True
-    )
-    registry.register_factory(
-        "disk_usage_triage", lambda: DiskUsageTriageTool(name="disk_usage_triage"), overwrite=True
-    )
-    registry.register_factory(
-        "verification_planner", lambda: VerificationPlannerTool(name="verification_planner"), overwrite=True
-    )
+_BUILTIN_TOOLS: Sequence[Tuple[str, type]] = (
+    ("nmap_scan", NmapScanTool),
+    ("firmware_diff", FirmwareDiffTool),
+    ("order_lookup", OrderLookupTool),
+    ("anomaly_scoring", AnomalyScoringTool),
+    ("edge_deployment_planner", EdgeDeploymentPlannerTool),
+    ("firmware_intake", FirmwareIntakeTool),
+    ("firmware_format_identifier", FirmwareFormatIdentifierTool),
+    ("architecture_inference", ArchitectureInferenceTool),
+    ("firmware_section_extractor", FirmwareSectionExtractorTool),
+    ("firmware_static_analyzer", FirmwareStaticAnalyzerTool),
+    ("secret_scanner", SecretScannerTool),
+    ("weakness_profiler", WeaknessProfilerTool),
+    ("firmware_directory_list", FirmwareDirectoryListTool),
+    ("firmware_entropy_check", FirmwareEntropyCheckTool),
+    ("firmware_preflight", FirmwarePreflightTool),
+    ("firmware_format_detector", FirmwareFormatDetectorTool),
+    ("firmware_prepare_binary", FirmwarePrepareBinaryTool),
+    ("firmware_extract", FirmwareExtractTool),
+    ("firmware_os_identifier", FirmwareOsIdentifierTool),
+    ("firmware_hex_to_bin", FirmwareHexToBinTool),
+    ("firmware_key_finder", FirmwareKeyFinderTool),
+    ("firmware_ghidra_handoff", FirmwareGhidraHandoffTool),
+    ("disk_usage_triage", DiskUsageTriageTool),
+    ("verification_planner", VerificationPlannerTool),
+)
+
+
+def register_builtin_tools(registry: ToolRegistry) -> None:
+    """Register built-in tool factories."""
+
+    for name, tool_class in _BUILTIN_TOOLS:
+        registry.register_factory(name, partial(tool_class, name=name), overwrite=True)
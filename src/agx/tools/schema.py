@@ -0,0 +1,49 @@
+"""Helpers for presenting tool schemas to language models."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+SCHEMA_CRUFT_KEYS = frozenset({"$schema", "additionalProperties", "title"})
+# Keywords whose value maps user-chosen names (e.g. a parameter called "title") to subschemas.
+SCHEMA_MAP_KEYS = frozenset({"properties", "patternProperties", "$defs", "definitions", "dependentSchemas"})
+# Keywords whose value is instance data or a list of names, not a subschema.
+SCHEMA_DATA_KEYS = frozenset({"const", "default", "enum", "examples", "required"})
+
+
+def strip_schema_cruft(obj: Any) -> Any:
+    """Recursively drop JSON-schema keywords that add tokens without guiding the model.
+
+    Only schema keywords are dropped: names under ``properties`` and similar maps, and
+    values such as ``default`` or ``enum``, are kept verbatim.
+    """
+
+    if isinstance(obj, dict):
+        stripped = {}
+        for key, value in obj.items():
+            if key in SCHEMA_CRUFT_KEYS:
+                continue
+            if key in SCHEMA_MAP_KEYS and isinstance(value, dict):
+                stripped[key] = {name: strip_schema_cruft(schema) for name, schema in value.items()}
+            elif key in SCHEMA_DATA_KEYS:
+                stripped[key] = value
+            else:
+                stripped[key] = strip_schema_cruft(value)
+        return stripped
+    if isinstance(obj, list):
+        return [strip_schema_cruft(item) for item in obj]
+    return obj
+
+
+def compact_description(description: str) -> str:
+    """Return a tool description, compacting it when it holds a JSON schema."""
+
+    text = description.strip()
+    if not text.startswith(("{", "[")):
+        return description
+    try:
+        schema = json.loads(text)
+    except ValueError:
+        return description
+    return json.dumps(strip_schema_cruft(schema), separators=(",", ":"))
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from agx.autogen_runner import AutogenOrchestrator
+from agx.config import ProjectConfig
+from agx.tasks.base import TaskState
+from agx.tasks.runner import TaskRunner
+
+CONFIG = """
+name: waves
+agents:
+  worker:
+    description: worker
+    tools: []
+tasks:
+  - id: fails
+    agent: worker
+    description: first
+  - id: peer
+    agent: worker
+    description: second
+"""
+
+
+def test_failed_wave_member_still_settles_prefetched_peers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orchestrator = AutogenOrchestrator(ProjectConfig.from_yaml(CONFIG), max_workers=2)
+    peer_started = threading.Event()
+    resolved = []
+    monkeypatch.setattr(
+        "agx.autogen_runner.resolve_bindings",
+        lambda value, **kwargs: resolved.append(value) or value,
+    )
+
+    def run_task(task_spec):
+        if task_spec.id == "fails":
+            assert peer_started.wait(5)
+            raise RuntimeError("boom")
+        peer_started.set()
+        return "FINAL: peer done"
+
+    monkeypatch.setattr(orchestrator, "run_task", run_task)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        orchestrator.run()
+
+    orchestrator._store.flush()
+    assert orchestrator._store.fetch("fails").state is TaskState.FAILED
+    peer = orchestrator._store.fetch("peer")
+    assert peer.state is TaskState.COMPLETED
+    assert peer.output == "FINAL: peer done"
+    # input and context of each task are resolved exactly once.
+    assert len(resolved) == 4
+
+
+GATED = """
+name: gated
+agents:
+  worker:
+    description: worker
+    tools: []
+tasks:
+  - id: a
+    agent: worker
+    description: first
+  - id: b
+    agent: worker
+    description: second
+    depends_on: [a]
+  - id: c
+    agent: worker
+    description: third
+  - id: d
+    agent: worker
+    description: fourth
+    depends_on: [c]
+  - id: gate
+    type: human_approval
+    agent: worker
+    description: approve
+  - id: after
+    agent: worker
+    description: after the gate
+"""
+
+
+def test_waves_keep_serial_order_up_to_the_human_gate(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orchestrator = AutogenOrchestrator(ProjectConfig.from_yaml(GATED), max_workers=2)
+    finished = []
+    lock = threading.Lock()
+
+    def run_task(task_spec):
+        with lock:
+            # d may only start once c, its dependency, has finished.
+            assert task_spec.id != "d" or "c" in finished
+            finished.append(task_spec.id)
+        return f"FINAL: {task_spec.id}"
+
+    monkeypatch.setattr(orchestrator, "run_task", run_task)
+
+    outputs = orchestrator.run()
+
+    assert sorted(finished) == ["a", "b", "c", "d"]
+    assert outputs["gate"].startswith("WAITING_HUMAN")
+    assert "after" not in outputs
+    waves = orchestrator._group_waves(TaskRunner.order_tasks(orchestrator.config.tasks))
+    assert {task_id: [member.id for member in wave] for task_id, wave in waves.items()} == {
+        "a": ["a", "c"],
+        "c": ["a", "c"],
+    }
+
+
+def test_waves_only_group_agents_that_opted_in():
+    config = ProjectConfig.from_yaml(GATED)
+    ordered = TaskRunner.order_tasks(config.tasks)
+
+    assert AutogenOrchestrator._group_waves(ordered, frozenset()) == {}
+    assert set(AutogenOrchestrator._group_waves(ordered, frozenset({"worker"}))) == {"a", "c"}
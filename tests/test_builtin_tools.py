@@ -0,0 +1,280 @@
+import difflib
+import shutil
+import sys
+from itertools import islice
+
+import pytest
+
+from agx.tools.base import ToolContext
+from agx.tools.builtin import (
+    FirmwareFormatIdentifierTool,
+    FirmwareOsIdentifierTool,
+    FirmwareSectionExtractorTool,
+    OrderLookupTool,
+    SecretScannerTool,
+    WeaknessProfilerTool,
+    _CommandStream,
+    _command_available,
+    _hex_dump,
+    _load_structured,
+    _match_magic,
+    _scan_magic,
+    _unified_diff,
+    register_builtin_tools,
+)
+from agx.tools.registry import ToolRegistry
+
+
+def _context():
+    return ToolContext(agent_name="analyst", task_id="t1", iteration=0)
+
+
+def test_match_magic_handles_offsets_and_wildcards():
+    header = bytearray(1024)
+    header[0:4] = bytes.fromhex("20001000")
+    header[0x1FE:0x200] = b"\x55\xaa"
+
+    matches = _match_magic(bytes(header))
+
+    assert [name for name, _, _ in matches] == ["MBR", "ARM Cortex-M vector table"]
+    assert not any(specific for _, _, specific in matches)
+    assert [name for name, _, _ in _match_magic(b"\x1f\x8b\x08")] == ["GZIP", "UBIFS"]
+    assert [(name, specific) for name, _, specific in _match_magic(b"\x7fELF")] == [("ELF (32/64-bit)", True)]
+    assert _match_magic(b"") == []
+
+
+def test_format_identifier_reports_catalog_matches(tmp_path):
+    firmware = tmp_path / "fw.bin"
+    firmware.write_bytes(b"\x7fELF" + bytes(60))
+
+    result = FirmwareFormatIdentifierTool(name="fmt").run(input_text=f'{{"path": "{firmware}"}}', context=_context())
+
+    assert result.metadata["magic"] == "ELF (32/64-bit)"
+    assert "- ELF (32/64-bit) (offset 0x0)" in result.content
+    assert "00000000: 7f45 4c46 0000" in result.content
+    assert not result.content.startswith("file")
+
+
+def test_format_identifier_still_runs_file_for_weak_matches(tmp_path, monkeypatch):
+    monkeypatch.setattr("agx.tools.builtin._command_available", lambda name: False)
+    calls = []
+    monkeypatch.setattr(
+        "agx.tools.builtin._run_command",
+        lambda args, **kwargs: calls.append(args) or {"code": 0, "stdout": "data", "stderr": ""},
+    )
+    firmware = tmp_path / "fw.bin"
+    firmware.write_bytes(bytes(64))
+
+    result = FirmwareFormatIdentifierTool(name="fmt").run(input_text=f'{{"path": "{firmware}"}}', context=_context())
+
+    assert result.metadata["magic"] == "FIT image"
+    assert calls == [["file", str(firmware)]]
+    assert result.content.startswith("file (ok):\ndata")
+
+
+def test_hex_dump_matches_xxd_layout():
+    assert _hex_dump(b"\x7fELF" + b"A" * 14) == (
+        "00000000: 7f45 4c46 4141 4141 4141 4141 4141 4141  .ELFAAAAAAAAAAAA\n"
+        "00000010: 4141                                     AA"
+    )
+    assert _hex_dump(b"") == ""
+
+
+def test_scan_magic_finds_embedded_images_and_skips_padding():
+    image = bytes(64) + b"\x7fELF" + bytes(60) + b"hsqs" + bytes(0x200) + b"EFI PI"
+
+    assert _scan_magic(image) == [(64, "ELF (32/64-bit)"), (128, "SquashFS"), (132, "GPT header")]
+    assert _scan_magic(bytes(4096)) == []
+    assert _scan_magic(image, limit=1) == [(64, "ELF (32/64-bit)")]
+
+
+def test_section_extractor_falls_back_to_catalog_scan(tmp_path, monkeypatch):
+    monkeypatch.setattr("agx.tools.builtin._command_available", lambda name: False)
+    firmware = tmp_path / "fw.bin"
+    firmware.write_bytes(bytes(16) + b"hsqs" + bytes(16))
+
+    result = FirmwareSectionExtractorTool(name="sections").run(input_text=f'{{"path": "{firmware}"}}', context=_context())
+
+    assert "0x00000010  SquashFS" in result.content
+    assert result.metadata["signatures"] == "1"
+
+
+def test_load_structured_sniffs_json_yaml_and_plain_text():
+    assert _load_structured('  {"path": "/tmp/fw.bin"}') == {"path": "/tmp/fw.bin"}
+    assert _load_structured("path: /tmp/fw.bin\nextract: true") == {"path": "/tmp/fw.bin", "extract": True}
+    assert _load_structured(" scan 10.0.0.1 now ") == "scan 10.0.0.1 now"
+    assert _load_structured("yes") is True
+    assert _load_structured("-") == [None]
+    assert _load_structured("") is None
+    assert _load_structured('{"n": 123456789012345678901234567890}') == {"n": 123456789012345678901234567890}
+    assert _load_structured("[NaN]")[0] != _load_structured("[NaN]")[0]
+
+
+def test_load_structured_hands_out_private_copies_of_cached_payloads():
+    text = "findings: [weak ssh]\nprotocols: [telnet]"
+
+    first = _load_structured(text)
+    first["findings"].append("mutated")
+
+    assert _load_structured(text) == {"findings": ["weak ssh"], "protocols": ["telnet"]}
+
+
+def test_unified_diff_trims_common_lines_but_keeps_line_numbers():
+    baseline = [f"pkg{i}=1.0" for i in range(200)]
+    current = list(baseline)
+    current[150] = "pkg150=2.0"
+    current.insert(40, "pkgnew=0.1")
+
+    expected = difflib.unified_diff(baseline, current, fromfile="baseline", tofile="current", lineterm="")
+
+    assert list(_unified_diff(baseline, current)) == list(expected)
+    assert list(_unified_diff(baseline, baseline)) == []
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_unified_diff_uses_git_for_large_inputs_with_difflib_layout():
+    baseline = [f"pkg{i}=1.0" for i in range(5000)]
+    current = [line + "-patched" if i % 500 == 7 else line for i, line in enumerate(baseline)]
+    del current[2500]
+
+    expected = difflib.unified_diff(baseline, current, fromfile="baseline", tofile="current", lineterm="")
+
+    assert list(_unified_diff(baseline, current)) == list(expected)
+
+
+@pytest.mark.skipif(shutil.which("strings") is None, reason="strings is not installed")
+def test_os_identifier_prefers_linux_over_rtos_tokens(tmp_path):
+    firmware = tmp_path / "fw.bin"
+    firmware.write_bytes(b"\x00" * 16 + b"FreeRTOS kernel\x00" + b"\xff" * 8 + b"BusyBox v1.36\x00")
+
+    result = FirmwareOsIdentifierTool(name="os").run(input_text=f'{{"path": "{firmware}"}}', context=_context())
+    assert result.metadata["os_guess"] == "Linux"
+
+    firmware.write_bytes(b"\x00" * 16 + b"Zephyr OS build\x00")
+    result = FirmwareOsIdentifierTool(name="os").run(input_text=f'{{"path": "{firmware}"}}', context=_context())
+    assert result.metadata["os_guess"] == "RTOS"
+
+
+def test_order_lookup_returns_rendered_order():
+    tool = OrderLookupTool(name="orders", orders=[{"id": 7, "status": "shipped"}])
+
+    hit = tool.run(input_text="7", context=_context())
+    miss = tool.run(input_text="8", context=_context())
+
+    assert hit.content == '{\n  "id": 7,\n  "status": "shipped"\n}'
+    assert hit.metadata == {"found": "true"}
+    assert miss.content == "Order 8 not found"
+
+
+def test_register_builtin_tools_names_each_instance():
+    registry = ToolRegistry()
+    register_builtin_tools(registry)
+
+    tools = registry.available()
+
+    assert len(tools) == 24
+    assert all(tool.name == name for name, tool in tools.items())
+    assert not any(hasattr(tool, "__dict__") for tool in tools.values())
+    assert isinstance(registry.get("order_lookup"), OrderLookupTool)
+
+
+def test_secret_scanner_reports_unique_indicators_from_blob():
+    tool = SecretScannerTool(name="secrets")
+
+    result = tool.run(input_text='{"blob": "PASSWORD=x token=y password=z"}', context=_context())
+
+    assert result.content == "Indicators: password, token"
+    assert result.metadata == {"hits": "3"}
+
+
+def test_secret_scanner_maps_firmware_without_ripgrep(tmp_path, monkeypatch):
+    monkeypatch.setattr("agx.tools.builtin._command_available", lambda name: False)
+    firmware = tmp_path / "fw.bin"
+    firmware.write_bytes(b"\xff\x00API_KEY=1\x00\xfe api-key Bearer x api_key")
+    tool = SecretScannerTool(name="secrets")
+
+    result = tool.run(input_text=f'{{"path": "{firmware}"}}', context=_context())
+
+    assert result.content == "Indicators: api-key, api_key, bearer"
+    assert result.metadata == {"hits": "4"}
+
+    firmware.write_bytes(b"")
+    assert tool.run(input_text=f'{{"path": "{firmware}"}}', context=_context()).content == "No secrets detected."
+
+
+@pytest.mark.skipif(shutil.which("strings") is None, reason="strings is not installed")
+def test_weakness_profiler_attributes_lines_to_every_matching_label(tmp_path, monkeypatch):
+    monkeypatch.setattr("agx.tools.builtin._command_available", lambda name: name == "strings")
+    firmware = tmp_path / "fw.bin"
+    firmware.write_bytes(b"\x00telnetd -l /bin/sh\x00\xffhttpd fw_update md5sum\x00nothing here\x00")
+
+    result = WeaknessProfilerTool(name="weakness").run(input_text=f'{{"path": "{firmware}"}}', context=_context())
+
+    assert "Protocols detected: ['telnet', 'http', 'ota', 'md5']" in result.content
+    assert "[ota] httpd fw_update md5sum" in result.content
+    assert result.metadata["score"] == "60"
+
+
+def test_weakness_profiler_streams_rg_past_frequent_keywords(tmp_path, monkeypatch):
+    # Stand-in rg: 600 md5 lines before the only telnetd one, honouring -m like rg does.
+    scanner = tmp_path / "bin" / "rg"
+    scanner.parent.mkdir()
+    scanner.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"open({str(tmp_path / 'args')!r}, 'w').write(' '.join(sys.argv[1:]))\n"
+        "lines = [f'{n}:md5sum' for n in range(1, 601)] + ['601:telnetd -l /bin/sh']\n"
+        "if '-m' in sys.argv:\n"
+        "    lines = lines[: int(sys.argv[sys.argv.index('-m') + 1])]\n"
+        "print('\\n'.join(lines))\n"
+    )
+    scanner.chmod(0o755)
+    monkeypatch.setenv("PATH", str(scanner.parent))
+    monkeypatch.setattr("agx.tools.builtin._command_available", lambda name: name == "rg")
+    firmware = tmp_path / "fw.bin"
+    firmware.write_bytes(b"")
+
+    result = WeaknessProfilerTool(name="weakness").run(input_text=f'{{"path": "{firmware}"}}', context=_context())
+
+    assert "Protocols detected: ['telnet', 'md5']" in result.content
+    assert "[telnet] 601:telnetd -l /bin/sh" in result.content
+    assert " -m 1000 " in (tmp_path / "args").read_text()
+
+
+def test_command_available_caches_per_path(tmp_path, monkeypatch):
+    tool = tmp_path / "fake-scanner"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+
+    monkeypatch.setenv("PATH", "")
+    assert not _command_available("fake-scanner")
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert _command_available("fake-scanner")
+
+
+@pytest.mark.skipif(shutil.which("yes") is None, reason="yes is not installed")
+def test_command_stream_stops_the_command_once_the_caller_is_done():
+    with _CommandStream(["yes", "token"], timeout=10) as stream:
+        lines = list(islice(stream, 3))
+
+    assert lines == ["token"] * 3
+    assert stream.result() == {"code": 0, "stdout": "token\ntoken\ntoken", "stderr": ""}
+
+
+@pytest.mark.skipif(shutil.which("yes") is None, reason="yes is not installed")
+def test_command_stream_keeps_only_a_head_of_stdout():
+    with _CommandStream(["yes", "token"], timeout=10, head_chars=20) as stream:
+        lines = list(islice(stream, 1000))
+
+    assert len(lines) == 1000
+    assert stream.result()["stdout"] == "\n".join(["token"] * 4)
+
+
+def test_command_stream_reports_missing_binaries_and_timeouts():
+    with _CommandStream(["agx-no-such-binary"]) as stream:
+        assert list(stream) == []
+    assert stream.result()["code"] == 127
+
+    with _CommandStream([sys.executable, "-c", "import time; time.sleep(5)"], timeout=1) as stream:
+        assert list(stream) == []
+    assert stream.result() == {"code": -1, "stdout": "", "stderr": "timeout after 1s"}
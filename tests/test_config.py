@@ -0,0 +1,55 @@
+from agx.config import ProjectConfig, import_string
+from agx.memory.simple import ConversationBufferMemory
+
+CONFIG = """
+name: cached
+agents:
+  worker:
+    tools: []
+tasks:
+  - id: t1
+    agent: worker
+    description: {description}
+"""
+
+
+def test_from_file_returns_independent_copies(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG.format(description="first"))
+
+    first = ProjectConfig.from_file(path)
+    first.tasks[0].input = {"mutated": True}
+    second = ProjectConfig.from_file(path)
+
+    assert second.tasks[0].input is None
+    assert second.file_path == path
+
+
+def test_from_file_reparses_after_edit(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG.format(description="first"))
+    assert ProjectConfig.from_file(path).tasks[0].description == "first"
+
+    path.write_text(CONFIG.format(description="second, longer"))
+
+    assert ProjectConfig.from_file(path).tasks[0].description == "second, longer"
+
+
+def test_import_string_resolves_each_path_once():
+    import_string.cache_clear()
+
+    first = import_string("agx.memory.simple:ConversationBufferMemory")
+    second = import_string("agx.memory.simple:ConversationBufferMemory")
+
+    assert first is second is ConversationBufferMemory
+    assert import_string.cache_info().hits == 1
+
+
+def test_peek_reads_header_without_parsing_tasks(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "agents:\n  worker:\n    tools: [a, b]\nname: peeked\ndescription: |\n  multi\n  line\n"
+        "tasks: [unterminated\n"
+    )
+
+    assert ProjectConfig.peek(path) == {"name": "peeked", "description": "multi\nline\n"}
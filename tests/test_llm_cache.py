@@ -0,0 +1,56 @@
+from agx.agents.base import Agent, PlanningConfig, PlanningLoop
+from agx.llm.cache import LLMCache, cache_key
+from agx.llm.provider import OllamaProvider, PromptContext
+from agx.memory.simple import ConversationBufferMemory
+from agx.tasks.base import Task
+
+
+class CountingProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate(self, prompt, context):
+        self.calls += 1
+        return '{"action": "final", "answer": "done"}'
+
+
+def test_llm_cache_round_trips_through_sqlite(tmp_path):
+    cache = LLMCache(tmp_path / "llm.db")
+    cache.set("k", "v")
+
+    reopened = LLMCache(tmp_path / "llm.db")
+
+    assert reopened.get("k") == "v"
+    assert reopened.get("missing") is None
+    assert reopened.stats()["hits"] == 1
+    assert reopened.stats()["misses"] == 1
+
+
+def test_planning_loop_reuses_cached_response(tmp_path):
+    provider = CountingProvider()
+    agent = Agent(
+        name="cached_agent",
+        description="Agent with cache",
+        llm_provider=provider,
+        tools={},
+        planning=PlanningConfig(max_iterations=2, reflection=False, cache_enabled=True),
+        memory=ConversationBufferMemory(),
+        llm_cache=LLMCache(tmp_path / "llm.db"),
+    )
+    task = Task(id="t1", agent_name="cached_agent", description="Repeatable task")
+
+    first = PlanningLoop(agent=agent, task=task).execute()
+    agent.memory.clear()
+    second = PlanningLoop(agent=agent, task=task).execute()
+
+    assert first.output == second.output == "done"
+    assert provider.calls == 1
+
+
+def test_cache_key_covers_system_prompt_and_host():
+    context = PromptContext(agent_name="a", task_id="t", iteration=0)
+    base = cache_key(OllamaProvider("llama3"), "hi", context)
+
+    assert cache_key(OllamaProvider("llama3"), "hi", context) == base
+    assert cache_key(OllamaProvider("llama3", system_prompt="Be terse."), "hi", context) != base
+    assert cache_key(OllamaProvider("llama3", host="http://gpu-box:11434"), "hi", context) != base
@@ -0,0 +1,53 @@
+from agx.agents.base import Agent, PlanningConfig, PlanningLoop
+from agx.memory.simple import ConversationBufferMemory
+from agx.tasks.base import Task
+
+
+class StreamingProvider:
+    def __init__(self, chunks) -> None:
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+
+    def generate(self, prompt, context):  # pragma: no cover - stream is preferred
+        raise AssertionError("generate should not be called when stream is available")
+
+    def stream(self, prompt, context):
+        try:
+            for chunk in self.chunks:
+                self.consumed += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def _run(provider):
+    agent = Agent(
+        name="streaming_agent",
+        description="Agent with streaming provider",
+        llm_provider=provider,
+        tools={},
+        planning=PlanningConfig(max_iterations=1, reflection=False),
+        memory=ConversationBufferMemory(),
+    )
+    task = Task(id="t1", agent_name="streaming_agent", description="Stream task")
+    return PlanningLoop(agent=agent, task=task).execute()
+
+
+def test_planning_loop_stops_stream_after_complete_action():
+    provider = StreamingProvider(['{"action": "final", ', '"answer": "done"}', "\nextra padding", " more"])
+
+    result = _run(provider)
+
+    assert result.output == "done"
+    assert provider.consumed == 2
+    assert provider.closed
+
+
+def test_planning_loop_reads_plain_text_stream_to_the_end():
+    provider = StreamingProvider(["FINAL: ", "all ", "good"])
+
+    result = _run(provider)
+
+    assert result.output == "FINAL: all good"
+    assert provider.consumed == 3
@@ -0,0 +1,14 @@
+from agx.memory.simple import ConversationBufferMemory
+
+
+def test_conversation_memory_renders_bounded_window():
+    memory = ConversationBufferMemory(max_items=2)
+    memory.add("tool", "one")
+    memory.add("assistant", "two")
+    memory.add("tool", "three")
+
+    assert [item.content for item in memory.dump()] == ["two", "three"]
+    assert memory.rendered() == "assistant: two\ntool: three"
+
+    memory.clear()
+    assert memory.rendered() == ""
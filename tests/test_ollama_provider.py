@@ -0,0 +1,37 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agx.llm.provider import OllamaProvider, PromptContext
+
+
+class FailingHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b"internal error"
+        self.send_response(500)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def failing_host():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FailingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_non_2xx_responses_raise_runtime_error(failing_host, stream):
+    provider = OllamaProvider("llama3", host=failing_host, stream=stream)
+
+    with pytest.raises(RuntimeError, match="HTTP 500 .*: internal error"):
+        provider.generate("hi", PromptContext(agent_name="a", task_id="t", iteration=0))
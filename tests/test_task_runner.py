@@ -0,0 +1,339 @@
+import json
+import re
+import sqlite3
+import threading
+
+import pytest
+
+from agx.config import AgentSpec, PlanningSpec
+from agx.tasks.base import HumanApprovalTask, Task, TaskResult, TaskState
+from agx.tasks.runner import (
+    TaskRunner,
+    TaskStateRecord,
+    TaskStateStore,
+    resolve_max_workers,
+    resolve_parallel_agents,
+)
+
+
+class RecordingAgent:
+    def __init__(self) -> None:
+        self.seen = []
+        self.threads = set()
+        self.thread_names = set()
+        self._lock = threading.Lock()
+
+    def run_task(self, task):
+        with self._lock:
+            self.seen.append(task.id)
+            self.threads.add(threading.get_ident())
+            self.thread_names.add(threading.current_thread().name)
+        return TaskResult(task=task, success=True, output=f"done:{task.id}", iterations=1, trace=[])
+
+
+def _tasks():
+    return [
+        Task(id="a", description="a", agent_name="worker"),
+        Task(id="b", description="b", agent_name="worker"),
+        Task(id="c", description="c", agent_name="worker", depends_on=["a", "b"]),
+    ]
+
+
+def test_run_all_respects_dependencies(tmp_path):
+    agent = RecordingAgent()
+    runner = TaskRunner(lambda name: agent, db_path=tmp_path / "state.db")
+
+    results = runner.run_all(_tasks())
+
+    assert agent.seen[-1] == "c"
+    assert {task_id: result.state for task_id, result in results.items()} == {
+        "a": TaskState.COMPLETED,
+        "b": TaskState.COMPLETED,
+        "c": TaskState.COMPLETED,
+    }
+
+
+def test_run_all_parallel_waves_complete_every_task(tmp_path):
+    agent = RecordingAgent()
+    runner = TaskRunner(lambda name: agent, db_path=tmp_path / "state.db", max_workers=4)
+
+    results = runner.run_all(_tasks())
+
+    assert set(agent.seen[:2]) == {"a", "b"}
+    assert agent.seen[-1] == "c"
+    assert all(result.success for result in results.values())
+
+
+def test_resolve_max_workers_honours_allow_parallel():
+    serial = AgentSpec(name="a", llm_provider=None, tools=[], planning=PlanningSpec())
+    parallel = AgentSpec(name="b", llm_provider=None, tools=[], planning=PlanningSpec(allow_parallel=True))
+
+    assert resolve_max_workers([serial]) == 1
+    assert resolve_max_workers([serial, parallel]) > 1
+    assert resolve_max_workers([serial], requested=3) == 3
+    assert resolve_parallel_agents([serial, parallel]) == {"b"}
+    assert resolve_parallel_agents([serial, parallel], requested=3) is None
+
+
+def test_run_all_fans_out_only_opted_in_agents_on_one_pool(tmp_path):
+    pooled, serial = RecordingAgent(), RecordingAgent()
+    agents = {"pooled": pooled, "serial": serial}
+    runner = TaskRunner(agents.__getitem__, db_path=tmp_path / "state.db", max_workers=4, parallel_agents={"pooled"})
+    tasks = [
+        Task(id="p1", description="p1", agent_name="pooled"),
+        Task(id="p2", description="p2", agent_name="pooled"),
+        Task(id="s1", description="s1", agent_name="serial"),
+        Task(id="s2", description="s2", agent_name="serial"),
+        Task(id="p3", description="p3", agent_name="pooled", depends_on=["p1", "p2"]),
+    ]
+
+    results = runner.run_all(tasks)
+
+    assert all(result.success for result in results.values())
+    assert serial.threads == {threading.get_ident()}
+    assert threading.get_ident() not in pooled.threads
+    # Every wave reuses the run's one executor.
+    assert len({name.rsplit("_", 1)[0] for name in pooled.thread_names}) == 1
+
+
+def test_state_store_upsert_many_round_trips(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+
+    store.upsert_many(
+        [
+            TaskStateRecord(task_id="a", state=TaskState.PENDING),
+            TaskStateRecord(task_id="b", state=TaskState.FAILED, error="dependency_failed", trace=["x"]),
+        ]
+    )
+    store.upsert(TaskStateRecord(task_id="a", state=TaskState.COMPLETED, output="ok"))
+
+    assert store.fetch("a").output == "ok"
+    assert store.fetch("b").trace == ["x"]
+    assert store.fetch("b").error == "dependency_failed"
+    store.close()
+
+
+def test_upsert_many_stamps_a_batch_once(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+
+    store.upsert_many(
+        [
+            TaskStateRecord(task_id="a", state=TaskState.PENDING),
+            TaskStateRecord(task_id="b", state=TaskState.PENDING),
+            TaskStateRecord(task_id="c", state=TaskState.PENDING, updated_at="2024-01-01T00:00:00+00:00"),
+        ],
+        updated_at="2025-06-01T12:00:00+00:00",
+    )
+
+    assert store.fetch("a").updated_at == store.fetch("b").updated_at == "2025-06-01T12:00:00+00:00"
+    assert store.fetch("c").updated_at == "2024-01-01T00:00:00+00:00"
+    store.close()
+
+
+def test_order_tasks_handles_deep_chains_and_cycles():
+    chain = [Task(id=f"t{i}", description="", agent_name="w", depends_on=[f"t{i - 1}"] if i else []) for i in range(5000)]
+
+    ordered = TaskRunner.order_tasks(list(reversed(chain)))
+
+    assert [task.id for task in ordered] == [task.id for task in chain]
+    cyclic = [
+        Task(id="a", description="", agent_name="w", depends_on=["b"]),
+        Task(id="b", description="", agent_name="w", depends_on=["a"]),
+        Task(id="c", description="", agent_name="w", depends_on=["a", "d"]),
+        Task(id="d", description="", agent_name="w", depends_on=["d"]),
+    ]
+    with pytest.raises(ValueError, match=re.escape("Cyclic dependency detected at task a; cycles=[['a', 'b'], ['d']]")):
+        TaskRunner.order_tasks(cyclic)
+
+
+def test_run_all_fails_everything_downstream_of_a_failure(tmp_path):
+    class FailingAgent(RecordingAgent):
+        def run_task(self, task):
+            super().run_task(task)
+            return TaskResult(task=task, success=task.id != "a", output=task.id, iterations=1, trace=[])
+
+    agent = FailingAgent()
+    tasks = [
+        Task(id="a", description="a", agent_name="worker"),
+        Task(id="b", description="b", agent_name="worker", depends_on=["a"]),
+        Task(id="c", description="c", agent_name="worker", depends_on=["b"]),
+        Task(id="d", description="d", agent_name="worker"),
+    ]
+    runner = TaskRunner(lambda name: agent, db_path=tmp_path / "state.db")
+
+    runner.run_all(tasks)
+
+    assert agent.seen == ["a", "d"]
+    assert runner._store.fetch("b").error == "dependency_failed"
+    assert runner._store.fetch("c").state == TaskState.FAILED
+
+
+def test_set_approval_preserves_state_and_reason(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+    store.upsert(TaskStateRecord(task_id="gate", state=TaskState.WAITING_HUMAN, reason="needs sign-off"))
+
+    store.set_approval("gate", True)
+    store.set_approval("fresh", False, reason="rejected")
+
+    gate = store.fetch("gate")
+    assert (gate.state, gate.reason, gate.approved) == (TaskState.WAITING_HUMAN, "needs sign-off", True)
+    fresh = store.fetch("fresh")
+    assert (fresh.state, fresh.reason, fresh.approved) == (TaskState.WAITING_HUMAN, "rejected", False)
+    store.close()
+
+
+def test_fetch_light_skips_trace(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+    store.upsert(
+        TaskStateRecord(task_id="t", state=TaskState.COMPLETED, output="ok", iterations=2, trace=["a"], approved=True)
+    )
+
+    light = store.fetch_light("t")
+
+    assert (light.state, light.output, light.approved) == (TaskState.COMPLETED, "ok", True)
+    assert light.trace is None and light.iterations is None
+    assert store.fetch_light("missing") is None
+    assert store.fetch_many(["t", "missing"]) == {"t": light}
+    store.close()
+
+
+def test_fetch_reads_json_text_trace(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+    store.upsert(TaskStateRecord(task_id="t", state=TaskState.COMPLETED, trace=["new"]))
+    store.flush()
+    with sqlite3.connect(store.db_path) as conn:
+        conn.execute("UPDATE task_runs SET trace = ? WHERE task_id = ?", ('["legacy", "row"]', "t"))
+
+    assert store.fetch("t").trace == ["legacy", "row"]
+    store.close()
+
+
+def test_trace_is_stored_as_json_text(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+    store.upsert(TaskStateRecord(task_id="t", state=TaskState.COMPLETED, trace=["a", "b"]))
+    store.flush()
+    with sqlite3.connect(store.db_path) as conn:
+        kind, raw = conn.execute("SELECT typeof(trace), trace FROM task_runs WHERE task_id = ?", ("t",)).fetchone()
+
+    assert kind == "text" and json.loads(raw) == ["a", "b"]
+    store.close()
+
+
+def test_run_all_preloads_task_rows_in_one_pass(tmp_path):
+    agent = RecordingAgent()
+    runner = TaskRunner(lambda name: agent, db_path=tmp_path / "state.db", approval_callback=lambda task: True)
+    reads = []
+    fetch_light = runner._store.fetch_light
+    runner._store.fetch_light = lambda task_id: reads.append(task_id) or fetch_light(task_id)
+    tasks = [
+        HumanApprovalTask(id="gate", description="gate", agent_name="worker", reason="sign-off"),
+        Task(id="work", description="work", agent_name="worker", depends_on=["gate"]),
+    ]
+
+    results = runner.run_all(tasks)
+
+    assert results["gate"].state == TaskState.COMPLETED
+    assert results["work"].state == TaskState.COMPLETED
+    assert reads == []
+
+
+def test_state_store_migrates_old_schema_once(tmp_path):
+    path = tmp_path / "state.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE task_runs (task_id TEXT PRIMARY KEY, state TEXT NOT NULL, output TEXT, "
+            "iterations INTEGER, trace TEXT, error TEXT, updated_at TEXT NOT NULL)"
+        )
+        conn.execute("PRAGMA user_version = 1")
+    conn.close()
+
+    TaskStateStore(path).close()
+    store = TaskStateStore(path)
+    store.set_approval("gate", True, reason="ok")
+
+    assert store.fetch("gate").approved is True
+    assert store._conn.execute("PRAGMA user_version").fetchone()[0] == 3
+    assert [record.task_id for record in store.fetch_by_state(TaskState.WAITING_HUMAN)] == ["gate"]
+    store.close()
+
+
+def test_results_are_a_read_only_view(tmp_path):
+    runner = TaskRunner(lambda name: RecordingAgent(), db_path=tmp_path / "state.db")
+
+    view = runner.run_all(_tasks()[:1])
+    snapshot = runner.results_snapshot()
+    runner.run_all(_tasks()[1:2])
+
+    assert view is runner.results()
+    assert set(view) == {"a", "b"}
+    assert set(snapshot) == {"a"}
+    with pytest.raises(TypeError):
+        view["c"] = None
+
+
+def test_state_store_commits_queued_writes_before_reads(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+    threads = [
+        threading.Thread(
+            target=lambda n=n: store.upsert(TaskStateRecord(task_id=f"t{n}", state=TaskState.COMPLETED))
+        )
+        for n in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store.fetch_by_state(TaskState.COMPLETED)) == 20
+    store.close()
+    with sqlite3.connect(tmp_path / "state.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM task_runs").fetchone()[0] == 20
+    conn.close()
+
+
+def test_state_store_uses_one_writer_thread(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+    writer = store._writer
+    for n in range(200):
+        store.upsert(TaskStateRecord(task_id=f"t{n}", state=TaskState.COMPLETED))
+    store.flush()
+
+    assert store._writer is writer and writer.is_alive()
+    assert len(store.fetch_by_state(TaskState.COMPLETED)) == 200
+    store.close()
+    assert not store._writer.is_alive()
+
+
+def _reject_task_rows(db_path, task_id):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TRIGGER reject BEFORE INSERT ON task_runs "
+            f"WHEN NEW.task_id = '{task_id}' BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        )
+    conn.close()
+
+
+def test_failed_write_is_reported_and_retried(tmp_path):
+    store = TaskStateStore(tmp_path / "state.db")
+    _reject_task_rows(store.db_path, "t")
+    store.upsert(TaskStateRecord(task_id="t", state=TaskState.COMPLETED))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        store.flush()
+    with sqlite3.connect(store.db_path) as conn:
+        conn.execute("DROP TRIGGER reject")
+    conn.close()
+    store.flush()
+
+    assert store.fetch("t").state == TaskState.COMPLETED
+    store.close()
+
+
+def test_run_surfaces_state_write_failures(tmp_path):
+    runner = TaskRunner(lambda name: RecordingAgent(), db_path=tmp_path / "state.db")
+    _reject_task_rows(runner._store.db_path, "a")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        runner.run(Task(id="a", description="a", agent_name="worker"))
+    with pytest.raises(sqlite3.IntegrityError):
+        runner._store.close()
@@ -0,0 +1,29 @@
+import json
+
+from agx.tools.schema import compact_description
+
+
+def test_compact_description_keeps_properties_named_like_keywords():
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "title": "CreateIssue",
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "title": {"type": "string", "title": "Title"},
+            "body": {"type": "string", "default": {"title": "kept"}},
+        },
+        "required": ["title"],
+    }
+
+    compacted = json.loads(compact_description(json.dumps(schema)))
+
+    assert compacted == {
+        "type": "object",
+        "properties": {"title": {"type": "string"}, "body": {"type": "string", "default": {"title": "kept"}}},
+        "required": ["title"],
+    }
+
+
+def test_compact_description_leaves_plain_text_alone():
+    assert compact_description("Looks up an order.") == "Looks up an order."